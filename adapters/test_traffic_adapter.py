@@ -49,6 +49,7 @@ class Adapter:
             "audioblock": True,
             "sdu_max_bytes": SDU_MAX_BYTES,
             "audioparams": {"sr": 8000, "block": 160},
+            "tx_tuple_form": True,  # poll_link_tx -> List[(bytes, t_ms)]
         }
 
     def init(self, cfg: dict) -> None:
@@ -93,6 +94,12 @@ class Adapter:
                 self._generate_packet()
                 self._last_tx_ms = t_ms
 
+    def next_tick_hint_ms(self, t_ms: int) -> Optional[int]:
+        """Prochain tick utile (runner --event-driven) ; None = tick suivant."""
+        if self.mode != "byte" or self._txq:
+            return None
+        return self._last_tx_ms + self._packet_interval_ms
+
     def _generate_packet(self) -> None:
         """Generate a test packet with sequence number and padding."""
         # Header: 4 bytes sequence number + side marker
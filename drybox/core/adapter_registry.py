@@ -5,12 +5,17 @@ import inspect
 from dataclasses import dataclass
 from importlib import import_module, metadata, util as importlib_util
 from pathlib import Path
-from typing import Dict, Iterable, List, Literal, Optional
+from types import ModuleType
+from typing import Dict, Iterable, List, Literal, Optional, Tuple
 
 from drybox.core.paths import PROJECT_ROOT, ADAPTERS_DIR as DEFAULT_ADAPTERS_DIR, normalize_path
 ENTRYPOINT_GROUP = "drybox.adapters"
 ENTRYPOINT_PREFIXES = ("entrypoint:", "pkg:")
 
+# Modules adaptateurs déjà exécutés, par (chemin, mtime_ns, taille) : les clones
+# d'un sweep ne ré-exécutent pas la source, un fichier modifié est rechargé.
+_MODULE_CACHE: Dict[Tuple[str, int, int], ModuleType] = {}
+
 
 @dataclass(frozen=True)
 class AdapterInfo:
@@ -62,16 +67,25 @@ def discover_entrypoint_adapters(group: str = ENTRYPOINT_GROUP) -> List[AdapterI
 def discover_local_adapters(adapters_dir: Optional[Path] = None) -> List[AdapterInfo]:
     """Return adapters implemented as local .py files under *adapters_dir*."""
     base = (adapters_dir or DEFAULT_ADAPTERS_DIR).resolve()
-    if not base.exists():
+    # Un seul scandir : type d'entrée lu depuis readdir, pas de Path ni de stat
+    # par entrée (symlinks suivis comme glob le faisait)
+    try:
+        with os.scandir(base) as it:
+            names = sorted(
+                e.name for e in it
+                if os.path.normcase(e.name).endswith(".py") and e.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
     results: List[AdapterInfo] = []
-    for path in sorted(base.glob("*.py")):
-        identifier = path.name
+    for name in names:
+        path = base / name
+        identifier = name
         results.append(
             AdapterInfo(
                 identifier=identifier,
-                display_name=f"{path.name} (local)",
+                display_name=f"{name} (local)",
                 spec=str(path),
                 source="file",
                 metadata={"path": str(path)},
@@ -125,6 +139,23 @@ def _split_spec(spec: str, default_class: str) -> tuple[str, str]:
     return path_part, class_name
 
 
+def _load_module_from_file(path: Path) -> ModuleType:
+    """Execute the adapter file at *path* once per on-disk version."""
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    module = _MODULE_CACHE.get(key)
+    if module is not None:
+        return module
+
+    module_spec = importlib_util.spec_from_file_location(path.stem, path)
+    if module_spec is None or module_spec.loader is None:
+        raise ImportError(f"Cannot import adapter from {path}")
+    module = importlib_util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)  # type: ignore[arg-type]
+    _MODULE_CACHE[key] = module
+    return module
+
+
 def _load_class_from_entrypoint(name: str):
     for ep in _iter_entry_points(ENTRYPOINT_GROUP):
         if ep.name == name:
@@ -162,11 +193,7 @@ def load_adapter_class(spec: str, *, default_class: str = "Adapter", adapters_di
     # Attempt filesystem resolution first
     path_candidate = _normalize_path_candidate(path_part, adapters_dir)
     if path_candidate is not None:
-        module_spec = importlib_util.spec_from_file_location(path_candidate.stem, path_candidate)
-        if module_spec is None or module_spec.loader is None:
-            raise ImportError(f"Cannot import adapter from {path_candidate}")
-        module = importlib_util.module_from_spec(module_spec)
-        module_spec.loader.exec_module(module)  # type: ignore[arg-type]
+        module = _load_module_from_file(path_candidate)
         try:
             return getattr(module, class_name)
         except AttributeError as exc:  # pragma: no cover - runtime error path
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import pathlib
 import struct
+from typing import Iterable, List, Optional, Tuple
+
+from drybox.core.io_thread import FILE_BUFFER_BYTES, IOThread, QueuedFile
 
 # On fige ici les libellés pour éviter une dépendance circulaire avec runner.py
 EVENT_TX = "tx"
@@ -12,6 +15,12 @@ EVENT_DROP = "drop"
 LAYER_BYTELINK = "bytelink"
 LAYER_BEARER = "bearer"
 
+# Nombre d'enregistrements accumulés avant écriture disque
+REC_FLUSH_N = 256
+
+# En-tête d'enregistrement : t_ms u64, side u8, layer u8, event u8, len u32
+_REC_HDR = struct.Struct("<QBBBI")
+
 
 class DbxCapWriter:
     """
@@ -26,6 +35,7 @@ class DbxCapWriter:
         event: u8 (0=tx,1=rx,2=drop)
         len: u32le
         data: bytes
+    Avec `io_thread`, les écritures disque sont déléguées à ce thread.
     """
     MAGIC = b"DBXC"
     VERSION = 1
@@ -34,20 +44,50 @@ class DbxCapWriter:
     LAYER_MAP = {LAYER_BYTELINK: 0, LAYER_BEARER: 1}
     SIDE_MAP = {"L": 0, "R": 1}
 
-    def __init__(self, path: pathlib.Path):
-        self._fp = open(path, "wb")
-        self._fp.write(self.MAGIC)
-        self._fp.write(bytes([self.VERSION]))
+    def __init__(self, path: pathlib.Path, io_thread: Optional[IOThread] = None):
+        self._fp = open(path, "wb", buffering=FILE_BUFFER_BYTES)
+        if io_thread is not None:
+            self._fp = QueuedFile(io_thread, self._fp)
+        self._fp.write(self.MAGIC + bytes((self.VERSION,)))
+        # Enregistrements encodés en attente (header, data, header, data, ...)
+        self._buf: List[bytes] = []
+        self._n = 0
+
+    def _append(self, t_ms: int, side: str, layer: str, event: str, data: bytes) -> None:
+        # Les données restent référencées jusqu'au flush : on ne copie que
+        # les tampons mutables (bytearray, memoryview), jamais un bytes
+        if type(data) is not bytes:
+            data = bytes(data)
+        self._buf.append(_REC_HDR.pack(
+            int(t_ms),
+            self.SIDE_MAP.get(side, 0),
+            self.LAYER_MAP.get(layer, 0),
+            self.EV_MAP.get(event, 0),
+            len(data),
+        ))
+        self._buf.append(data)
+        self._n += 1
+
+    def _flush_records(self) -> None:
+        # Lot cédé tel quel (pas de join côté boucle) ; nouvelle liste ensuite
+        self._fp.writelines(self._buf)
+        self._buf = []
+        self._n = 0
 
     def write(self, *, t_ms: int, side: str, layer: str, event: str, data: bytes) -> None:
-        side_b = self.SIDE_MAP.get(side, 0)
-        layer_b = self.LAYER_MAP.get(layer, 0)
-        ev_b = self.EV_MAP.get(event, 0)
-        rec = struct.pack("<QBBB", int(t_ms), side_b, layer_b, ev_b)
-        self._fp.write(rec)
-        self._fp.write(struct.pack("<I", len(data)))
-        self._fp.write(data)
+        self._append(t_ms, side, layer, event, data)
+        if self._n >= REC_FLUSH_N:
+            self._flush_records()
+
+    def write_many(self, records: Iterable[Tuple[int, str, str, str, bytes]]) -> None:
+        """Écrit un lot de (t_ms, side, layer, event, data) dans l'ordre."""
+        for t_ms, side, layer, event, data in records:
+            self._append(t_ms, side, layer, event, data)
+        if self._n >= REC_FLUSH_N:
+            self._flush_records()
 
     def close(self) -> None:
+        if self._buf:
+            self._flush_records()
         self._fp.flush()
         self._fp.close()
@@ -0,0 +1,83 @@
+# MIT License
+# drybox/core/io_thread.py — Écritures disque des sorties sur un thread dédié
+from __future__ import annotations
+
+import queue
+import threading
+from typing import IO, Any, List, Optional, Tuple
+
+# Tampon des fichiers de sortie (metrics.csv, events.jsonl, capture.dbxcap) :
+# les lots de 256 enregistrements s'y accumulent, un appel système par Mio
+FILE_BUFFER_BYTES = 1 << 20
+
+
+class IOThread:
+    """
+    Thread daemon unique d'écriture disque.
+    Les writers postent des (fichier, bloc) dans une file FIFO ; un bloc None
+    ferme le fichier, une liste est écrite par writelines(). L'ordre
+    d'écriture par fichier est donc celui de la boucle de simulation, qui
+    ne bloque plus sur les appels système.
+    """
+
+    def __init__(self, name: str = "drybox-io"):
+        self._q: "queue.SimpleQueue[Optional[Tuple[IO[Any], Any]]]" = queue.SimpleQueue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._drain, name=name, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._q.get()
+            if item is None:
+                return
+            fp, chunk = item
+            try:
+                if chunk is None:
+                    fp.close()
+                elif self._error is None:
+                    if type(chunk) is list:
+                        fp.writelines(chunk)
+                    else:
+                        fp.write(chunk)
+            except BaseException as e:  # remontée au close() côté runner
+                if self._error is None:
+                    self._error = e
+
+    def write(self, fp: IO[Any], chunk: Any) -> None:
+        self._q.put((fp, chunk))
+
+    def close_file(self, fp: IO[Any]) -> None:
+        self._q.put((fp, None))
+
+    def close(self) -> None:
+        """Vide la file, termine le thread et relève la première erreur d'écriture."""
+        self._q.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+class QueuedFile:
+    """
+    Façade fichier (write/writelines/flush/close) déléguant à un IOThread, pour les
+    writers existants (csv.DictWriter inclus) sans changer leur code.
+    """
+
+    def __init__(self, io_thread: IOThread, fp: IO[Any]):
+        self._io = io_thread
+        self._fp = fp
+
+    def write(self, chunk: Any) -> None:
+        self._io.write(self._fp, chunk)
+
+    def writelines(self, chunks: List[Any]) -> None:
+        # La liste est cédée au thread : l'appelant ne doit plus la modifier
+        self._io.write(self._fp, chunks)
+
+    def flush(self) -> None:
+        # Le thread écrit dans l'ordre ; close() garantit la vidange
+        pass
+
+    def close(self) -> None:
+        self._io.close_file(self._fp)
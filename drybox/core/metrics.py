@@ -5,7 +5,14 @@ from __future__ import annotations
 import csv
 import json
 import pathlib
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+from drybox.core.io_thread import FILE_BUFFER_BYTES, IOThread, QueuedFile
+
+try:
+    import orjson  # optionnel : sérialisation events.jsonl plus rapide
+except ImportError:
+    orjson = None
 
 # En-tête strictement identique (ordre inclus) à celui utilisé dans runner.py
 CSV_HEADER = [
@@ -30,10 +37,52 @@ CSV_HEADER = [
 ]
 
 
-def _fmt(x: Optional[float]) -> str:
-    if x is None:
-        return ""
-    return f"{x:.6f}"
+def _row_template(event: str, *cols: str) -> str:
+    """
+    Gabarit %-format d'une ligne CSV: t_ms, side, layer, `event` fixe, puis
+    `cols` en .6f ; colonnes absentes vides. Même rendu que write_metric().
+    """
+    fields = ["%d", "%s", "%s", event] + [""] * (len(CSV_HEADER) - 4)
+    for c in cols:
+        fields[CSV_HEADER.index(c)] = "%.6f"
+    return ",".join(fields) + "\r\n"
+
+
+# Lignes pré-formatées pour les émissions fréquentes du runner
+_ROW_TX = _row_template("tx", "rtt_ms_est")
+_ROW_RX = _row_template("rx", "latency_ms", "jitter_ms", "loss_rate", "reorder_rate")
+_ROW_RX_LATENCY = _row_template("rx", "latency_ms")
+_ROW_RX_SNR = _row_template("rx", "snr_db_est")
+_ROW_DROP_PER = _row_template("drop", "per")
+_ROW_TICK_GOODPUT = _row_template("tick", "goodput_bps")
+
+# Nombre de lignes (CSV pré-formatées / events) accumulées avant écriture disque
+ROW_FLUSH_N = 256
+
+
+def _event_line_std(rec: Dict[str, Any]) -> bytes:
+    # JSON compact UTF-8 (mêmes séparateurs que la sortie orjson)
+    return json.dumps(rec, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _event_line(rec: Dict[str, Any]) -> bytes:
+        try:
+            return orjson.dumps(rec, option=_ORJSON_OPTS)
+        except TypeError:  # type hors orjson (ex. entier > 64 bits)
+            return _event_line_std(rec)
+else:
+    _event_line = _event_line_std
+
+
+class _RowSink:
+    """Cible de csv.writer : chaque ligne rendue rejoint le tampon de lignes."""
+    __slots__ = ("write",)
+
+    def __init__(self, buf: List[str]):
+        self.write = buf.append
 
 
 class MetricsWriter:
@@ -41,13 +90,74 @@ class MetricsWriter:
     Écrit:
       - metrics.csv (colonnes fixes CSV_HEADER)
       - events.jsonl (lignes JSON {"t_ms","side","type","payload"})
+    Avec `io_thread`, les écritures disque sont déléguées à ce thread.
     """
 
-    def __init__(self, csv_path: pathlib.Path, events_path: pathlib.Path):
-        self._csv_fp = open(csv_path, "w", newline="")
-        self._csv = csv.DictWriter(self._csv_fp, fieldnames=CSV_HEADER)
-        self._csv.writeheader()
-        self._events_fp = open(events_path, "w", encoding="utf-8")
+    def __init__(
+        self,
+        csv_path: pathlib.Path,
+        events_path: pathlib.Path,
+        io_thread: Optional[IOThread] = None,
+    ):
+        self._csv_fp = open(csv_path, "w", newline="", buffering=FILE_BUFFER_BYTES)
+        self._events_fp = open(events_path, "wb", buffering=FILE_BUFFER_BYTES)
+        if io_thread is not None:
+            self._csv_fp = QueuedFile(io_thread, self._csv_fp)
+            self._events_fp = QueuedFile(io_thread, self._events_fp)
+        # csv.writer positionnel rendant dans le même tampon que les lignes
+        # pré-formatées : ordre conservé, une écriture disque par lot
+        self._buf: List[str] = []
+        self._csv = csv.writer(_RowSink(self._buf))
+        self._csv.writerow(CSV_HEADER)
+        self._ev_buf: List[bytes] = []
+
+    def _flush_rows(self) -> None:
+        self._csv_fp.write("".join(self._buf))
+        self._buf.clear()
+
+    def _flush_events(self) -> None:
+        self._events_fp.write(b"".join(self._ev_buf))
+        self._ev_buf.clear()
+
+    # ---- Variantes spécialisées (hot path runner) ----
+    def write_tx(self, t_ms: int, side: str, layer: str, rtt_ms_est: float) -> None:
+        self._buf.append(_ROW_TX % (t_ms, side, layer, rtt_ms_est))
+        if len(self._buf) >= ROW_FLUSH_N:
+            self._flush_rows()
+
+    def write_rx(
+        self,
+        t_ms: int,
+        side: str,
+        layer: str,
+        latency_ms: float,
+        jitter_ms: float,
+        loss_rate: float,
+        reorder_rate: float,
+    ) -> None:
+        self._buf.append(_ROW_RX % (t_ms, side, layer, latency_ms, jitter_ms, loss_rate, reorder_rate))
+        if len(self._buf) >= ROW_FLUSH_N:
+            self._flush_rows()
+
+    def write_rx_latency(self, t_ms: int, side: str, layer: str, latency_ms: float) -> None:
+        self._buf.append(_ROW_RX_LATENCY % (t_ms, side, layer, latency_ms))
+        if len(self._buf) >= ROW_FLUSH_N:
+            self._flush_rows()
+
+    def write_rx_snr(self, t_ms: int, side: str, layer: str, snr_db_est: float) -> None:
+        self._buf.append(_ROW_RX_SNR % (t_ms, side, layer, snr_db_est))
+        if len(self._buf) >= ROW_FLUSH_N:
+            self._flush_rows()
+
+    def write_drop_per(self, t_ms: int, side: str, layer: str, per: float) -> None:
+        self._buf.append(_ROW_DROP_PER % (t_ms, side, layer, per))
+        if len(self._buf) >= ROW_FLUSH_N:
+            self._flush_rows()
+
+    def write_tick_goodput(self, t_ms: int, side: str, layer: str, goodput_bps: float) -> None:
+        self._buf.append(_ROW_TICK_GOODPUT % (t_ms, side, layer, goodput_bps))
+        if len(self._buf) >= ROW_FLUSH_N:
+            self._flush_rows()
 
     def write_metric(
         self,
@@ -71,27 +181,29 @@ class MetricsWriter:
         rekey_ms: Optional[float] = None,
         aead_fail_cnt: Optional[int] = None,
     ) -> None:
-        row = {
-            "t_ms": t_ms,
-            "side": side,
-            "layer": layer,
-            "event": event,
-            "rtt_ms_est": _fmt(rtt_ms_est),
-            "latency_ms": _fmt(latency_ms),
-            "jitter_ms": _fmt(jitter_ms),
-            "loss_rate": _fmt(loss_rate),
-            "reorder_rate": _fmt(reorder_rate),
-            "goodput_bps": _fmt(goodput_bps),
-            "snr_db_est": _fmt(snr_db_est),
-            "ber": _fmt(ber),
-            "per": _fmt(per),
-            "cfo_hz_est": _fmt(cfo_hz_est),
-            "lock_ratio": _fmt(lock_ratio),
-            "hs_time_ms": _fmt(hs_time_ms),
-            "rekey_ms": _fmt(rekey_ms),
-            "aead_fail_cnt": aead_fail_cnt if aead_fail_cnt is not None else "",
-        }
-        self._csv.writerow(row)
+        # Ordre des colonnes = CSV_HEADER
+        self._csv.writerow((
+            t_ms,
+            side,
+            layer,
+            event,
+            "" if rtt_ms_est is None else f"{rtt_ms_est:.6f}",
+            "" if latency_ms is None else f"{latency_ms:.6f}",
+            "" if jitter_ms is None else f"{jitter_ms:.6f}",
+            "" if loss_rate is None else f"{loss_rate:.6f}",
+            "" if reorder_rate is None else f"{reorder_rate:.6f}",
+            "" if goodput_bps is None else f"{goodput_bps:.6f}",
+            "" if snr_db_est is None else f"{snr_db_est:.6f}",
+            "" if ber is None else f"{ber:.6f}",
+            "" if per is None else f"{per:.6f}",
+            "" if cfo_hz_est is None else f"{cfo_hz_est:.6f}",
+            "" if lock_ratio is None else f"{lock_ratio:.6f}",
+            "" if hs_time_ms is None else f"{hs_time_ms:.6f}",
+            "" if rekey_ms is None else f"{rekey_ms:.6f}",
+            "" if aead_fail_cnt is None else aead_fail_cnt,
+        ))
+        if len(self._buf) >= ROW_FLUSH_N:
+            self._flush_rows()
 
     def write_event(self, t_ms: int, side: str, typ: str, payload: Dict[str, Any]) -> None:
         rec = {"t_ms": t_ms, "side": side, "type": typ, "payload": payload}
@@ -111,7 +223,9 @@ class MetricsWriter:
                     except Exception as e:
                         pass
         
-        self._events_fp.write(json.dumps(rec) + "\n")
+        self._ev_buf.append(_event_line(rec))
+        if len(self._ev_buf) >= ROW_FLUSH_N:
+            self._flush_events()
 
     def set_bytes_callback(self, callback):
         """Register callback for total_bytes_processed updates.
@@ -121,8 +235,12 @@ class MetricsWriter:
 
     def close(self) -> None:
         try:
+            if self._buf:
+                self._flush_rows()
             self._csv_fp.flush()
             self._csv_fp.close()
         finally:
+            if self._ev_buf:
+                self._flush_events()
             self._events_fp.flush()
             self._events_fp.close()
@@ -7,17 +7,24 @@ This module provides centralized path handling that:
 """
 from __future__ import annotations
 
+import atexit
+import contextlib
+import functools
 import sys
 from pathlib import Path, PurePath
-from typing import Optional
+from typing import Optional, Tuple
 
 import platformdirs
 
 
 # --- Project Root Detection ---
+# drybox/core/, resolved once: realpath costs one lstat per path component
+_CORE_DIR = Path(__file__).resolve().parent
+
+
 def _find_project_root() -> Path:
     """Find project root by looking for pyproject.toml or .git"""
-    current = Path(__file__).resolve().parent
+    current = _CORE_DIR
     for parent in [current] + list(current.parents):
         if (parent / "pyproject.toml").exists() or (parent / ".git").exists():
             return parent
@@ -25,7 +32,7 @@ def _find_project_root() -> Path:
 
 
 PROJECT_ROOT = _find_project_root()
-DRYBOX_PKG_DIR = Path(__file__).resolve().parent.parent  # drybox/
+DRYBOX_PKG_DIR = _CORE_DIR.parent  # drybox/
 
 # --- Standard Directories ---
 SCENARIOS_DIR = DRYBOX_PKG_DIR / "scenarios"
@@ -101,19 +108,32 @@ def resolve_resource_path(*parts: str, pkg_fallback: bool = True) -> Optional[Pa
 
     # 2. Fallback to importlib.resources for wheel/zipapp installs
     if pkg_fallback:
-        try:
-            from importlib import resources
-            traversable = resources.files("drybox")
-            for part in parts:
-                traversable = traversable.joinpath(part)
-
-            # Use as_file() context to get real path
-            with resources.as_file(traversable) as real_path:
-                if real_path.exists():
-                    return normalize_path(Path(real_path))
-        except (TypeError, FileNotFoundError, AttributeError):
-            pass  # MultiplexedPath issues or missing resource
+        return _pkg_resource_path(parts)
+
+    return None
+
+
+# Fichiers extraits par importlib.resources.as_file() (installs zip) : gardés
+# jusqu'à la fin du process pour que le chemin renvoyé reste lisible
+_EXTRACTED_RESOURCES = contextlib.ExitStack()
+atexit.register(_EXTRACTED_RESOURCES.close)
+
+
+@functools.lru_cache(maxsize=64)
+def _pkg_resource_path(parts: Tuple[str, ...]) -> Optional[Path]:
+    """Resolve *parts* through importlib.resources, extracting at most once per resource."""
+    try:
+        from importlib import resources
+        traversable = resources.files("drybox")
+        for part in parts:
+            traversable = traversable.joinpath(part)
+
+        real_path = _EXTRACTED_RESOURCES.enter_context(resources.as_file(traversable))
+    except (TypeError, FileNotFoundError, NotADirectoryError, AttributeError):
+        return None  # MultiplexedPath issues or missing resource
 
+    if real_path.exists():
+        return normalize_path(Path(real_path))
     return None
 
 
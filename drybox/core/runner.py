@@ -10,11 +10,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
+import multiprocessing
+import operator
 import pathlib
+import queue
 import random
 import sys
-from typing import Any, Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field
 
 try:
     import yaml  # PyYAML
@@ -23,6 +31,12 @@ except ImportError as e:
         "PyYAML is required. Install with `uv add pyyaml` or `pip install pyyaml`."
     ) from e
 
+# Parseur/émetteur libyaml si PyYAML a été compilé avec, sinon pur Python
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+
 try:
     import numpy as np
 except ImportError:
@@ -33,6 +47,24 @@ DEFAULT_TICK_MS = 1
 DEFAULT_SEED = 0
 DEFAULT_SDU_MAX = 1024  # avant fragmentation SAR
 DEFAULT_MODE = "audio"  # défaut global v1 (Mode B), ByteLink reste supporté
+GOODPUT_WINDOW_MS = 1000  # fenêtre de goodput (mode A)
+UI_QUEUE_MAX = 8  # lignes UI en attente max (au-delà: drop, jamais bloquant)
+UI_PERIOD_MS = 100  # cadence UI en temps logique
+UI_MIN_WALL_NS = 100_000_000  # et au plus une ligne / 100 ms réels (runs rapides)
+# Gabarits des lignes UI (une seule interpolation par ligne émise)
+UI_LINE_BYTE = (
+    "[%6d ms] "
+    "L->R loss=%.3f reord=%.3f jitter=%.1fms | "
+    "R->L loss=%.3f reord=%.3f jitter=%.1fms | "
+    "rtt=%.0fms gp_l=%.0fbps gp_r=%.0fbps"
+)
+UI_LINE_AUDIO = (
+    "[%6d ms] Mode B Audio | "
+    "snr=%.1fdB ber=%.4f per=%.3f "
+    "total_bytes=%d total_lost_bytes=%d "
+    "total_bytes_l=%s total_bytes_r=%s"
+)
+LOSS_DRAW_BLOCK = 256  # tirages uniformes de perte audio générés par appel numpy
 
 # --- Layers/events (sémantique simple) ---
 LAYER_BYTELINK = "bytelink"
@@ -46,6 +78,7 @@ EVENT_TICK = "tick"
 # --- Dépendances locales ---
 from drybox.core.metrics import MetricsWriter  # A1
 from drybox.core.capture import DbxCapWriter  # A1
+from drybox.core.io_thread import IOThread
 from drybox.core.adapter_registry import load_adapter_class
 from drybox.core.scenario import (  # A2
     ScenarioResolved,
@@ -60,6 +93,9 @@ from drybox.net.sar_lite import SARFragmenter, SARReassembler
 
 from drybox.core.crypto_keys import resolve_keypairs, key_id
 
+# ((L_priv, L_pub, prov), (R_priv, R_pub, prov)) tel que retourné par resolve_keypairs
+KeyPairs = Tuple[Tuple[bytes, bytes, str], Tuple[bytes, bytes, str]]
+
 # Channel imports (conditionally loaded)
 try:
     from drybox.radio.channel_awgn import AWGNChannel
@@ -76,7 +112,7 @@ try:
 except ImportError:
     create_vocoder = None
 
-@dataclass
+@dataclass(slots=True)
 class AudioFlow:
     src: Any
     dst: Any
@@ -85,8 +121,16 @@ class AudioFlow:
     label: str
     vocoder: Optional[Any] = None
     channel: Optional[Any] = None
+    # Méthodes liées résolues une fois (None si l'adaptateur ne les expose pas)
+    push_tx_block: Optional[Callable[..., Any]] = None
+    pull_rx_block: Optional[Callable[..., Any]] = None
+    # Ni canal ni vocodeur : le bloc PCM est transmis tel quel
+    passthrough: bool = field(init=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        self.passthrough = self.channel is None and self.vocoder is None
+
+@dataclass(slots=True)
 class ByteFlow:
     bearer: DatagramBearer
     frag: Optional[SARFragmenter]
@@ -96,6 +140,13 @@ class ByteFlow:
     cap_side: str
     metrics_side: str
     side_label: str
+    # Méthodes liées résolues une fois (None si l'adaptateur ne les expose pas)
+    poll_link_tx: Optional[Callable[..., Any]] = None
+    on_link_rx: Optional[Callable[..., Any]] = None
+    # poll_link_tx annoncé en List[(bytes, t_ms)] (capability "tx_tuple_form")
+    tx_tuple_form: bool = False
+    # Octets de SDU délivrés côté metrics_side sur la fenêtre de goodput courante
+    rx_bytes: int = 0
 
 # --------- Contexte adaptateur ----------
 class AdapterCtx:
@@ -106,20 +157,21 @@ class AdapterCtx:
     - side: "L" | "R"
     - rng: générateur déterministe côté runner
     - config: dict léger (tick_ms, mode, sdu_max_bytes, seed, side)
+
+    L'horloge est lue dans une boîte partagée ([t_ms], tenue à jour par le
+    Runner) : now_ms() est un partial(getitem) sans closure ni lambda.
     """
 
-    def __init__(self, *, side: str, rng: random.Random, get_time_ms, emit_event, config: Dict[str, Any]):
+    def __init__(self, *, side: str, rng: random.Random, time_box: List[int], write_event, config: Dict[str, Any]):
         self.side = side
         self.rng = rng
-        self._get_time_ms = get_time_ms
-        self._emit_event = emit_event
+        self._time_box = time_box
+        self._write_event = write_event
         self.config = config
-
-    def now_ms(self) -> int:
-        return self._get_time_ms()
+        self.now_ms: Callable[[], int] = functools.partial(operator.getitem, time_box, 0)
 
     def emit_event(self, typ: str, payload: Dict[str, Any]) -> None:
-        self._emit_event(self.side, typ, payload)
+        self._write_event(self._time_box[0], self.side, typ, payload)
 
 
 # --------- Runner ----------
@@ -134,6 +186,8 @@ class Runner:
             tick_ms: int = DEFAULT_TICK_MS,
             seed: int = DEFAULT_SEED,
             ui_enabled: bool = True,
+            preresolved_keys: Optional[KeyPairs] = None,
+            event_driven: bool = False,
     ):
         self.scenario = scenario
         self.left_adapter_spec = left_adapter_spec
@@ -142,18 +196,47 @@ class Runner:
         self.tick_ms = tick_ms
         self.seed = seed
         self.ui_enabled = ui_enabled
+        # Paires de clés déjà résolues (sweep: identiques pour tous les clones)
+        self.preresolved_keys = preresolved_keys
+        # Saut direct au prochain événement au lieu d'itérer chaque tick vide
+        self.event_driven = event_driven
 
         # RNG global seedé (déterminisme)
         self.rng = random.Random(seed)
+        # Générateur numpy (PCG64) pour les tirages de perte audio, par blocs
+        self.np_rng = np.random.default_rng(seed) if np is not None else None
+        self._loss_u: Iterator[float] = iter(())
 
         # Sorties (A1)
         self.out_dir.mkdir(parents=True, exist_ok=True)
-        self.metrics = MetricsWriter(self.out_dir / "metrics.csv", self.out_dir / "events.jsonl")
-        self.cap = DbxCapWriter(self.out_dir / "capture.dbxcap")
+        # Écritures disque (metrics, events, capture) sur un thread dédié
+        self._io = IOThread()
+        self.metrics = MetricsWriter(self.out_dir / "metrics.csv", self.out_dir / "events.jsonl", self._io)
+        self.cap = DbxCapWriter(self.out_dir / "capture.dbxcap", self._io)
 
-        # Horloge logique
+        # Horloge logique (+ boîte partagée lue par les AdapterCtx)
         self.t_ms: int = 0
+        self._time_box: List[int] = [0]
+
+        # UI stderr: lignes formatées poussées dans une file bornée, écrites
+        # par un thread daemon (pas d'I/O terminal sur la boucle de ticks)
+        self._ui_q: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=UI_QUEUE_MAX)
+        self._ui_thread: Optional[threading.Thread] = None
         
+        # Config réseau / modem figée une fois (constante sur le run)
+        # Schema: network: { bearer: "volte_evs", latency_ms: 20, ... }
+        self._network_cfg: Dict[str, Any] = dict(scenario.network or {})
+        self._left_modem_cfg: Dict[str, Any] = dict((scenario.left or {}).get("modem", {}) or {})
+        self._right_modem_cfg: Dict[str, Any] = dict((scenario.right or {}).get("modem", {}) or {})
+        self.bearer_type: str = self._network_cfg.get("bearer", "volte_evs")
+        # params are everything in network except the 'bearer' key
+        self.bearer_params: Dict[str, Any] = {k: v for k, v in self._network_cfg.items() if k != "bearer"}
+
+        # Paramètres bearer typés (lus par les helpers) ; MTU résolu dans run()
+        self.loss_rate: float = float(self.bearer_params.get("loss_rate", 0.0))
+        self.mtu_bytes: int = DEFAULT_SDU_MAX
+        self.latency_ms: int = int(self.bearer_params.get("latency_ms", 60))
+
         # Metrics
         self.total_bytes_l = 0
         self.total_bytes_r = 0
@@ -169,6 +252,11 @@ class Runner:
         self.messages_right: List[Dict[str, Any]] = []
         self.message_index_left = 0
         self.message_index_right = 0
+        # Hooks handshake/messages des adaptateurs (résolus dans run())
+        self._handshake_left: Optional[Callable[[], bool]] = None
+        self._handshake_right: Optional[Callable[[], bool]] = None
+        self._send_sdu_left: Optional[Callable[[bytes], Any]] = None
+        self._send_sdu_right: Optional[Callable[[bytes], Any]] = None
 
     # --------- Load messages from file ----------
     def _load_messages(self) -> None:
@@ -185,7 +273,7 @@ class Runner:
         
         try:
             with open(messages_path, 'r', encoding='utf-8') as f:
-                messages_data = yaml.safe_load(f)
+                messages_data = yaml.load(f.read(), Loader=_YLoader)
                 self.messages_left = messages_data.get("left", [{"delay_ms": 0, "text": "Hello from L"}])
                 self.messages_right = messages_data.get("right", [{"delay_ms": 0, "text": "Hello from R"}])
                 
@@ -250,8 +338,8 @@ class Runner:
         ctx = AdapterCtx(
             side=side,
             rng=self.rng,
-            get_time_ms=lambda: self.t_ms,
-            emit_event=lambda side_, typ, payload: self.metrics.write_event(self.t_ms, side_, typ, payload),
+            time_box=self._time_box,
+            write_event=self.metrics.write_event,
             config=cfg,
         )
         if hasattr(inst, "start"):
@@ -287,15 +375,46 @@ class Runner:
         (self.out_dir / "pubkeys.txt").write_text("\n".join(txt), encoding="utf-8")
     
     # Helpers
-    def _safe_call(self, label: str, fn, *args, **kwargs):
+    def _ui_drain(self) -> None:
+        """Thread UI: écrit les lignes de la file sur stderr jusqu'au sentinel None."""
+        while True:
+            msg = self._ui_q.get()
+            if msg is None:
+                return
+            print(msg, file=sys.stderr)
+
+    def _ui_emit(self, msg: str) -> None:
+        """Pousse une ligne UI sans bloquer ; si la file est pleine, la ligne est perdue."""
+        try:
+            self._ui_q.put_nowait(msg)
+        except queue.Full:
+            pass
+
+    def _sub_seed(self, tag: str) -> int:
         """
-        Helper to call adapter methods and catch exceptions; returns None on error.
+        Seed dérivé (stable) pour un sous-flux aléatoire nommé (channel, vocodeur...).
+        Hash blake2b de "seed:tag" -> u32 (borne de np.random.RandomState), ce qui
+        décorrèle les flux et permet d'en ajouter sans décaler les existants.
         """
-        try:
-            return fn(*args, **kwargs)
-        except Exception as e:
-            print(f"[ERROR] {label}: {e}", file=sys.stderr)
-            return None
+        digest = hashlib.blake2b(f"{self.seed}:{tag}".encode(), digest_size=4).digest()
+        return int.from_bytes(digest, "big")
+
+    def _next_loss_u(self) -> float:
+        """Tirage U[0,1) suivant, servi depuis un bloc de LOSS_DRAW_BLOCK tirages numpy."""
+        u = next(self._loss_u, None)
+        if u is None:
+            self._loss_u = iter(self.np_rng.random(LOSS_DRAW_BLOCK).tolist())
+            u = next(self._loss_u)
+        return u
+
+    @staticmethod
+    def _log_adapter_error(label: str, e: Exception) -> None:
+        """
+        Report an adapter call failure; the run goes on. Hot-path call sites
+        wrap the adapter call in try/except inline (no wrapper frame, label
+        only formatted on error).
+        """
+        print(f"[ERROR] {label}: {e}", file=sys.stderr)
 
     def _apply_vocoder_and_loss(self, pcm_in, flow: AudioFlow):
         """
@@ -316,18 +435,14 @@ class Runner:
         if flow.vocoder is None:
             return pcm_processed, frame_lost
 
-        loss_rate = self.bearer_params.get("loss_rate", 0.0)
-        if self.rng.random() < loss_rate:
+        # loss_rate nul : aucun tirage
+        loss_rate = self.loss_rate
+        if loss_rate > 0.0 and self._next_loss_u() < loss_rate:
             # Frame lost - PLC
             pcm_processed = flow.vocoder.process_frame(None)
             frame_lost = True
-            self.metrics.write_metric(
-                t_ms=self.t_ms,
-                side=flow.rx_side,
-                layer=LAYER_AUDIOBLOCK,
-                event=EVENT_DROP,
-                per=1.0,  # Packet error rate = 1 for this frame
-            )
+            # Packet error rate = 1 for this frame
+            self.metrics.write_drop_per(self.t_ms, flow.rx_side, LAYER_AUDIOBLOCK, 1.0)
         else:
             bitstream = flow.vocoder.encode(pcm_processed)
             pcm_processed = flow.vocoder.decode(bitstream)
@@ -337,14 +452,8 @@ class Runner:
 
     def _write_audio_tx_rx_metrics(self, tx_side: str, rx_side: str, rtt_est: float):
         # Keep same metric keys as original
-        self.metrics.write_metric(
-            t_ms=self.t_ms, side=tx_side, layer=LAYER_AUDIOBLOCK, event=EVENT_TX,
-            rtt_ms_est=float(rtt_est)
-        )
-        self.metrics.write_metric(
-            t_ms=self.t_ms, side=rx_side, layer=LAYER_AUDIOBLOCK, event=EVENT_RX,
-            latency_ms=0.0
-        )
+        self.metrics.write_tx(self.t_ms, tx_side, LAYER_AUDIOBLOCK, float(rtt_est))
+        self.metrics.write_rx_latency(self.t_ms, rx_side, LAYER_AUDIOBLOCK, 0.0)
     
     def _on_bytes_processed_update(self, side: str, total_bytes: int) -> None:
         """Callback to track total_bytes_processed from demod events."""
@@ -353,9 +462,29 @@ class Runner:
         elif side == "R":
             self.total_bytes_r = total_bytes
 
+    def _passthrough_audio_direction(self, flow: AudioFlow, rtt_est: float) -> bool:
+        """Chemin identité (flow.passthrough) ; True si un bloc a été transmis."""
+        try:
+            pcm = flow.push_tx_block(self.t_ms)
+        except Exception as e:
+            self._log_adapter_error(f"{flow.label} audio push", e)
+            return False
+        if pcm is None or pcm.size == 0:
+            return False
+        try:
+            flow.pull_rx_block(pcm, self.t_ms)
+        except Exception as e:
+            self._log_adapter_error(f"{flow.label} audio pull", e)
+        self._write_audio_tx_rx_metrics(flow.tx_side, flow.rx_side, rtt_est)
+        return True
+
     def _process_audio_direction(self, flow: AudioFlow, rtt_est: float) -> Optional[Dict[str, Any]]:
         """Process audio in one direction and return metrics dict for UI tracking."""
-        pcm = self._safe_call(f"{flow.label} audio push", flow.src.push_tx_block, self.t_ms)
+        try:
+            pcm = flow.push_tx_block(self.t_ms)
+        except Exception as e:
+            self._log_adapter_error(f"{flow.label} audio push", e)
+            return None
         if pcm is None or pcm.size == 0:
             return None
 
@@ -368,11 +497,7 @@ class Runner:
             if hasattr(flow.channel, "get_estimated_snr"):
                 snr_est = flow.channel.get_estimated_snr(pcm, pcm_processed)
                 result_metrics['snr_db'] = snr_est
-                self.metrics.write_metric(
-                    t_ms=self.t_ms, side=flow.rx_side,
-                    layer=LAYER_AUDIOBLOCK, event=EVENT_RX,
-                    snr_db_est=snr_est,
-                )
+                self.metrics.write_rx_snr(self.t_ms, flow.rx_side, LAYER_AUDIOBLOCK, snr_est)
             # Estimate BER from signal degradation
             if hasattr(flow.channel, "estimate_ber"):
                 ber_est = flow.channel.estimate_ber()
@@ -383,7 +508,10 @@ class Runner:
         result_metrics['frame_lost'] = frame_lost
 
         # Deliver
-        self._safe_call(f"{flow.label} audio pull", flow.dst.pull_rx_block, pcm_processed, self.t_ms)
+        try:
+            flow.pull_rx_block(pcm_processed, self.t_ms)
+        except Exception as e:
+            self._log_adapter_error(f"{flow.label} audio pull", e)
 
         # Metrics
         self._write_audio_tx_rx_metrics(flow.tx_side, flow.rx_side, rtt_est)
@@ -392,75 +520,118 @@ class Runner:
     
     def _poll_and_send_bytemode(self, flow: ByteFlow, rtt_est: float, budget_per_tick: int):
         """
-        Poll flow.src.poll_link_tx, normalize SDUs, fragment if needed, and send via flow.bearer.
+        Poll flow.poll_link_tx, normalize SDUs, fragment if needed, and send via flow.bearer.
         """
-        res = self._safe_call(f"{flow.side_label} poll_link_tx", flow.src.poll_link_tx, budget_per_tick)
+        try:
+            res = flow.poll_link_tx(budget_per_tick)
+        except Exception as e:
+            self._log_adapter_error(f"{flow.side_label} poll_link_tx", e)
+            return
         if not res:
             return
 
-        try:
-            sdus: List[bytes] = [
-                b if isinstance(b, (bytes, bytearray)) else b[0] for b in res
-            ]
-        except Exception:
-            sdus = []
-
+        # Forme usuelle List[bytes] : on réutilise la liste telle quelle ;
+        # sinon List[(bytes, t_ms)] -> on extrait les SDUs. Un adaptateur qui
+        # annonce tx_tuple_form saute la sonde du premier élément.
+        if flow.tx_tuple_form:
+            sdus: List[bytes] = [b[0] if type(b) is tuple else b for b in res]
+        elif isinstance(res[0], (bytes, bytearray)):
+            sdus = res
+        else:
+            try:
+                sdus = [b if isinstance(b, (bytes, bytearray)) else b[0] for b in res]
+            except Exception:
+                sdus = []
+
+        # Captures TX du poll regroupées en un seul lot
+        cap_recs: List[Tuple[int, str, str, str, bytes]] = []
+        t_ms = self.t_ms
+        side = flow.cap_side
+        frag = flow.frag
+        send = flow.bearer.send
+        write_tx = self.metrics.write_tx
+        rtt = float(rtt_est)
         for sdu in sdus:
-            payloads = [sdu]
-            if flow.frag is not None:
-                payloads = flow.frag.fragment(sdu)
+            payloads = (sdu,) if frag is None else frag.iter_fragments(sdu)
             for p in payloads:
-                flow.bearer.send(p, now_ms=self.t_ms)
-                self.cap.write(
-                    t_ms=self.t_ms,
-                    side=flow.cap_side,
-                    layer=LAYER_BEARER,
-                    event=EVENT_TX,
-                    data=bytes(p),
-                )
-                self.metrics.write_metric(
-                    t_ms=self.t_ms,
-                    side=flow.cap_side,
-                    layer=LAYER_BEARER,
-                    event=EVENT_TX,
-                    rtt_ms_est=float(rtt_est),
-                )
+                send(p, now_ms=t_ms)
+                cap_recs.append((t_ms, side, LAYER_BEARER, EVENT_TX, p))
+                write_tx(t_ms, side, LAYER_BEARER, rtt)
+        if cap_recs:
+            self.cap.write_many(cap_recs)
         
-    def _deliver_bearer_to_adapter(self, dat, flow: ByteFlow):
+    def _deliver_batch_to_adapter(self, flow: ByteFlow, sent_ms: List[int], payloads: List[bytes]):
         """
-        Deliver a datagram from flow.bearer to flow.dst (via optional reassembly).
+        Deliver the datagrams polled from flow.bearer this tick to flow.dst
+        (via optional reassembly). Un seul chemin pour L->R et R->L ; les
+        captures RX du lot partent en un write_many.
         """
-        self.cap.write(
-            t_ms=self.t_ms,
-            side=flow.cap_side,
-            layer=LAYER_BEARER,
-            event=EVENT_RX,
-            data=bytes(dat.payload),
-        )
-        lat = float(self.t_ms - dat.sent_ms)
-        sdu: Optional[bytes] = dat.payload
-        if flow.reasm is not None:
-            sdu = flow.reasm.push_fragment(dat.payload, now_ms=self.t_ms)
-
-        if sdu is not None and hasattr(flow.dst, "on_link_rx"):
-            flow.dst.on_link_rx(sdu)
-            st = flow.bearer.stats()
-            self.metrics.write_metric(
-                t_ms=self.t_ms,
-                side=flow.metrics_side,
-                layer=LAYER_BYTELINK,
-                event=EVENT_RX,
-                latency_ms=lat,
-                jitter_ms=st.jitter_ms,
-                loss_rate=st.loss_rate,
-                reorder_rate=st.reorder_rate,
-            )
+        t_ms = self.t_ms
+        side = flow.cap_side
+        self.cap.write_many([(t_ms, side, LAYER_BEARER, EVENT_RX, p) for p in payloads])
+
+        reasm = flow.reasm
+        on_link_rx = flow.on_link_rx
+        # Stats figées pour tout le lot : poll_deliver_batch les a déjà mises
+        # à jour et l'adaptateur n'a pas accès au bearer
+        st = flow.bearer.stats() if on_link_rx is not None else None
+        write_rx = self.metrics.write_rx
+        metrics_side = flow.metrics_side
+        rx_bytes = 0
+        for sent, payload in zip(sent_ms, payloads):
+            sdu = payload if reasm is None else reasm.push_fragment(payload, now_ms=t_ms)
+            if sdu is None:
+                continue
+            rx_bytes += len(sdu)
+            if on_link_rx is not None:
+                on_link_rx(sdu)
+                write_rx(
+                    t_ms, metrics_side, LAYER_BYTELINK,
+                    float(t_ms - sent), st.jitter_ms, st.loss_rate, st.reorder_rate,
+                )
+        flow.rx_bytes += rx_bytes
     
-    def _send_msg_if_handshake_is_complete(self, left, right):
+    def _next_event_ms(
+            self,
+            hints: List[Callable[[int], Optional[int]]],
+            bearers: List[DatagramBearer],
+            window_start_ms: int,
+    ) -> int:
+        """
+        Prochain instant (aligné sur la grille de ticks) où la boucle a
+        quelque chose à faire : indice d'adaptateur, livraison bearer,
+        fenêtre de goodput ou message programmé. La ligne UI suit le
+        prochain événement.
+        """
+        t, tick = self.t_ms, self.tick_ms
+        target = window_start_ms + GOODPUT_WINDOW_MS
+        for hint in hints:
+            h = hint(t)
+            if h is None or h <= t:
+                return t + tick
+            target = min(target, h)
+        for bearer in bearers:
+            d = bearer.next_deliver_ms()
+            if d is not None:
+                target = min(target, d)
+        if self.handshake_done and self.handshake_complete_time_ms is not None:
+            for msgs, idx in ((self.messages_left, self.message_index_left),
+                              (self.messages_right, self.message_index_right)):
+                if idx < len(msgs):
+                    due = self.handshake_complete_time_ms + msgs[idx].get("delay_ms", 0)
+                    if due > t:
+                        target = min(target, due)
+        if target <= t:
+            return t + tick
+        # Arrondi au tick supérieur : mêmes instants que la boucle à pas fixe
+        return -(-target // tick) * tick
+
+    def _send_msg_if_handshake_is_complete(self):
         """Send timed messages based on delay after handshake completion."""
         if not self.handshake_done:
-            l_ready = left.is_handshake_complete() if hasattr(left, 'is_handshake_complete') else True
-            r_ready = right.is_handshake_complete() if hasattr(right, 'is_handshake_complete') else True
+            hs_l, hs_r = self._handshake_left, self._handshake_right
+            l_ready = hs_l() if hs_l is not None else True
+            r_ready = hs_r() if hs_r is not None else True
 
             if l_ready and r_ready:
                 self.handshake_done = True
@@ -473,27 +644,29 @@ class Runner:
         time_since_handshake = self.t_ms - self.handshake_complete_time_ms
 
         # Check and send left messages
-        if hasattr(left, 'send_sdu'):
+        send_sdu = self._send_sdu_left
+        if send_sdu is not None:
             while self.message_index_left < len(self.messages_left):
                 msg_info = self.messages_left[self.message_index_left]
                 delay_ms = msg_info.get("delay_ms", 0)
                 
                 if time_since_handshake >= delay_ms:
                     msg_text = msg_info.get("text", "")
-                    left.send_sdu(msg_text.encode('utf-8'))
+                    send_sdu(msg_text.encode('utf-8'))
                     self.message_index_left += 1
                 else:
                     break
                 
         # Check and send right messages
-        if hasattr(right, 'send_sdu'):
+        send_sdu = self._send_sdu_right
+        if send_sdu is not None:
             while self.message_index_right < len(self.messages_right):
                 msg_info = self.messages_right[self.message_index_right]
                 delay_ms = msg_info.get("delay_ms", 0)
                 
                 if time_since_handshake >= delay_ms:
                     msg_text = msg_info.get("text", "")
-                    right.send_sdu(msg_text.encode('utf-8'))
+                    send_sdu(msg_text.encode('utf-8'))
                     self.message_index_right += 1
                 else:
                     break
@@ -505,15 +678,31 @@ class Runner:
 
     # --------- Exécution ----------
     def run(self) -> int:
+        try:
+            return self._run_session()
+        finally:
+            # Tout chemin de sortie (adaptateur introuvable, exit 3...) vide
+            # l'en-tête dbxcap, l'en-tête CSV et les événements init/start,
+            # puis arrête le thread drybox-io.
+            try:
+                self.metrics.close()
+                self.cap.close()
+            finally:
+                self._io.close()
+
+    def _run_session(self) -> int:
         self._load_messages()
 
         # --- Résolution des paires de clés ---
-        (l_priv, l_pub, l_prov), (r_priv, r_pub, r_prov) = resolve_keypairs(
-            scenario_crypto=self.scenario.crypto,
-            seed=self.scenario.seed,
-            left_spec=self.left_adapter_spec,
-            right_spec=self.right_adapter_spec,
-        )
+        keys = self.preresolved_keys
+        if keys is None:
+            keys = resolve_keypairs(
+                scenario_crypto=self.scenario.crypto,
+                seed=self.scenario.seed,
+                left_spec=self.left_adapter_spec,
+                right_spec=self.right_adapter_spec,
+            )
+        (l_priv, l_pub, l_prov), (r_priv, r_pub, r_prov) = keys
         # Dump *publics* uniquement
         self._dump_pubkeys(l_pub=l_pub, r_pub=r_pub, l_prov=l_prov, r_prov=r_prov)
 
@@ -544,89 +733,60 @@ class Runner:
         # Callback for bytes processed metrics
         self.metrics.set_bytes_callback(self._on_bytes_processed_update)
 
-        # 1) Configure bearer (translate 'network' => bearer type + params)
-        # Schema: network: { bearer: "volte_evs", latency_ms: 20, ... }
-        network_cfg = dict(self.scenario.network or {})
-        bearer_type = network_cfg.get("bearer", "volte_evs")
-        # params are everything in network except the 'bearer' key
-        bearer_params = {k: v for k, v in network_cfg.items() if k != "bearer"}
-
-        # store for helpers (loss_rate, latency, mtu lookup)
-        self.bearer_type = bearer_type
-        self.bearer_params = bearer_params
-
-        bearer_l2r: DatagramBearer = make_bearer(bearer_type, bearer_params, self.rng)
-        bearer_r2l: DatagramBearer = make_bearer(bearer_type, bearer_params, self.rng)
+        # 1) Configure bearer (type + params figés dans __init__)
+        bearer_params = self.bearer_params
+        bearer_l2r: DatagramBearer = make_bearer(self.bearer_type, bearer_params, self.rng)
+        bearer_r2l: DatagramBearer = make_bearer(self.bearer_type, bearer_params, self.rng)
 
 
         # 2) SAR-lite si MTU < SDU_MAX
         sdu_max = int(left_caps.get("sdu_max_bytes", DEFAULT_SDU_MAX))
-        mtu = int(self.bearer_params.get("mtu_bytes", sdu_max))
-        sar_active = mtu < sdu_max
-        frag_l2r = SARFragmenter(mtu_bytes=mtu) if sar_active else None
-        frag_r2l = SARFragmenter(mtu_bytes=mtu) if sar_active else None
+        self.mtu_bytes = int(bearer_params.get("mtu_bytes", sdu_max))
+        sar_active = self.mtu_bytes < sdu_max
+        frag_l2r = SARFragmenter(mtu_bytes=self.mtu_bytes) if sar_active else None
+        frag_r2l = SARFragmenter(mtu_bytes=self.mtu_bytes) if sar_active else None
 
         # 3) Channel setup (Mode B only)
         # In schema, channel config lives in adapter 'modem' (left/right). We'll prefer left.modem.
         channel = None
-        left_modem_cfg = dict(self.scenario.left.get("modem", {}) or {})
+        left_modem_cfg = self._left_modem_cfg
+        right_modem_cfg = self._right_modem_cfg
         # If left.modem empty, fallback to right.modem
-        if not left_modem_cfg:
-            left_modem_cfg = dict(self.scenario.right.get("modem", {}) or {})
+        channel_cfg = left_modem_cfg or right_modem_cfg
 
-        channel_type = left_modem_cfg.get("channel_type")
+        channel_type = channel_cfg.get("channel_type")
         if self.scenario.mode == "audio" and channel_type:
             if channel_type == "awgn" and AWGNChannel:
-                snr_db = left_modem_cfg.get("snr_db", 20.0)
-                channel = AWGNChannel(snr_db, seed=self.seed)
+                snr_db = channel_cfg.get("snr_db", 20.0)
+                channel = AWGNChannel(snr_db, seed=self._sub_seed("channel"))
             elif channel_type in ["fading", "rayleigh"] and RayleighFadingChannel:
-                snr_db = left_modem_cfg.get("snr_db", 20.0)
-                fd_hz = left_modem_cfg.get("doppler_hz", 50.0)
-                L = left_modem_cfg.get("num_paths", 8)
-                channel = RayleighFadingChannel(snr_db, fd_hz, L, seed=self.seed)
+                snr_db = channel_cfg.get("snr_db", 20.0)
+                fd_hz = channel_cfg.get("doppler_hz", 50.0)
+                L = channel_cfg.get("num_paths", 8)
+                channel = RayleighFadingChannel(snr_db, fd_hz, L, seed=self._sub_seed("channel"))
 
         
         # 4) Vocoder setup (Mode B only)
         vocoder_l2r = None
         vocoder_r2l = None
-        left_modem_cfg = dict(self.scenario.left.get("modem", {}) or {})
-        right_modem_cfg = dict(self.scenario.right.get("modem", {}) or {})
 
         # prefer explicit vocoder type set in modem config
         vocoder_type = left_modem_cfg.get("vocoder") or right_modem_cfg.get("vocoder")
         if self.scenario.mode == "audio" and vocoder_type and create_vocoder:
             vad_dtx = left_modem_cfg.get("vad_dtx", False) or right_modem_cfg.get("vad_dtx", False)
-            vocoder_l2r = create_vocoder(vocoder_type, vad_dtx, seed=self.seed)
-            vocoder_r2l = create_vocoder(vocoder_type, vad_dtx, seed=self.seed + 1)
+            vocoder_l2r = create_vocoder(vocoder_type, vad_dtx, seed=self._sub_seed("voc_l2r"))
+            vocoder_r2l = create_vocoder(vocoder_type, vad_dtx, seed=self._sub_seed("voc_r2l"))
 
         
         # 5) Réassemblage (timeout = 2×RTT_est ; RTT_est ~ 2×latency_ms si fourni)
-        lat_ms = int(self.bearer_params.get("latency_ms", 60))
-        rtt_est = max(1, 2 * lat_ms)
+        rtt_est = max(1, 2 * self.latency_ms)
         reasm_r2l = SARReassembler(rtt_estimate_ms=2 * rtt_est, expect_header=sar_active)  # R->L
         reasm_l2r = SARReassembler(rtt_estimate_ms=2 * rtt_est, expect_header=sar_active)  # L->R
 
         # 6) Boucle
         duration = int(self.scenario.duration_ms)
         budget_per_tick = 64  # SDUs max par tick
-        last_ui_print = -10_000
 
-        # fenêtres goodput (1 s)
-        bytes_rx_l = 0
-        bytes_rx_r = 0
-        window_start_ms = 0
-
-        # Track goodput for UI display
-        last_goodput_l = 0.0
-        last_goodput_r = 0.0
-
-        # Track audio metrics for UI display
-        last_snr_db = 0.0
-        last_ber = 0.0
-        last_per = 0.0
-        audio_symbols_total = 0
-        audio_symbols_lost = 0
-        
         # --- Byte flows (mode A) ---
         flows_byte = [
             ByteFlow(
@@ -638,6 +798,9 @@ class Runner:
                 cap_side="L",
                 metrics_side="R",
                 side_label="LEFT",
+                poll_link_tx=getattr(left, "poll_link_tx", None),
+                on_link_rx=getattr(right, "on_link_rx", None),
+                tx_tuple_form=bool(left_caps.get("tx_tuple_form", False)),
             ),
             ByteFlow(
                 bearer=bearer_r2l,
@@ -648,6 +811,9 @@ class Runner:
                 cap_side="R",
                 metrics_side="L",
                 side_label="RIGHT",
+                poll_link_tx=getattr(right, "poll_link_tx", None),
+                on_link_rx=getattr(left, "on_link_rx", None),
+                tx_tuple_form=bool(right_caps.get("tx_tuple_form", False)),
             ),
         ]
 
@@ -661,6 +827,8 @@ class Runner:
                 label="L->R",
                 vocoder=vocoder_l2r,
                 channel=channel,
+                push_tx_block=getattr(left, "push_tx_block", None),
+                pull_rx_block=getattr(right, "pull_rx_block", None),
             ),
             AudioFlow(
                 src=right,
@@ -670,91 +838,28 @@ class Runner:
                 label="R->L",
                 vocoder=vocoder_r2l,
                 channel=channel,
+                push_tx_block=getattr(right, "push_tx_block", None),
+                pull_rx_block=getattr(left, "pull_rx_block", None),
             ),
         ]
 
-        try:
-            while self.t_ms <= duration:
-                # (1) Ticks avant toute I/O
-                for a in (left, right):
-                    if hasattr(a, "on_timer"):
-                        a.on_timer(self.t_ms)  # type: ignore[attr-defined]
-
-                # (2) Mode-specific I/O et Livraison via bearer L->R R->L
-                if self.scenario.mode == "byte":
-                    # Mode A: ByteLink
-                    for flow in flows_byte:
-                        if hasattr(flow.src, "poll_link_tx"):
-                            self._poll_and_send_bytemode(flow, rtt_est, budget_per_tick)
-                        for dat in flow.bearer.poll_deliver(self.t_ms):
-                            self._deliver_bearer_to_adapter(dat, flow)
-                        
-                        self._send_msg_if_handshake_is_complete(left, right)
-
-                elif self.scenario.mode == "audio":
-                    # Mode B: AudioBlock
-                    if np is None:
-                        raise SystemExit("Mode B (audio) requires numpy. Install with `pip install numpy`.")
-                    for flow in flows_audio:
-                        if hasattr(flow.src, "push_tx_block") and hasattr(flow.dst, "pull_rx_block"):
-                            audio_metrics = self._process_audio_direction(flow, rtt_est)
-                            
-                            self._send_msg_if_handshake_is_complete(left, right)
-                                
-                            if audio_metrics:
-                                audio_symbols_total += 1
-                                if audio_metrics.get('snr_db') is not None:
-                                    last_snr_db = audio_metrics['snr_db']
-                                if audio_metrics.get('ber') is not None:
-                                    last_ber = audio_metrics['ber']
-                                if audio_metrics.get('frame_lost'):
-                                    audio_symbols_lost += 1
-
-                # (5) Goodput fenêtré (1 s)
-                if self.scenario.mode == "byte" and self.t_ms - window_start_ms >= 1000:
-                    dur = max(1, self.t_ms - window_start_ms)
-                    g_l = (bytes_rx_l * 8) / dur * 1000.0
-                    g_r = (bytes_rx_r * 8) / dur * 1000.0
-                    last_goodput_l = g_l
-                    last_goodput_r = g_r
-                    self.metrics.write_metric(t_ms=self.t_ms, side="L", layer=LAYER_BYTELINK, event=EVENT_TICK,
-                                              goodput_bps=g_l)
-                    self.metrics.write_metric(t_ms=self.t_ms, side="R", layer=LAYER_BYTELINK, event=EVENT_TICK,
-                                              goodput_bps=g_r)
-                    bytes_rx_l = 0
-                    bytes_rx_r = 0
-                    window_start_ms = self.t_ms
-
-                # (6) UI minimale (stderr)
-                if self.ui_enabled and (self.t_ms - last_ui_print) >= 100:
-                    if self.scenario.mode == "byte":
-                        s_l: BearerStatsSnapshot = bearer_l2r.stats()
-                        s_r: BearerStatsSnapshot = bearer_r2l.stats()
-                        print(
-                            f"[{self.t_ms:6d} ms] "
-                            f"L->R loss={s_l.loss_rate:.3f} reord={s_l.reorder_rate:.3f} jitter={s_l.jitter_ms:.1f}ms | "
-                            f"R->L loss={s_r.loss_rate:.3f} reord={s_r.reorder_rate:.3f} jitter={s_r.jitter_ms:.1f}ms | "
-                            f"rtt={rtt_est:.0f}ms gp_l={last_goodput_l:.0f}bps gp_r={last_goodput_r:.0f}bps",
-                            file=sys.stderr,
-                        )
-                    elif self.scenario.mode == "audio":
-                        # Calculate PER from tracked frames
-                        per_value = (audio_symbols_lost / audio_symbols_total) if audio_symbols_total > 0 else 0.0
-                        total_bytes = audio_symbols_total // 8
-                        total_lost_bytes = audio_symbols_lost // 8
-                        
-                        print(
-                            f"[{self.t_ms:6d} ms] Mode B Audio | "
-                            f"snr={last_snr_db:.1f}dB ber={last_ber:.4f} per={per_value:.3f} "
-                            f"total_bytes={total_bytes} total_lost_bytes={total_lost_bytes} "
-                            f"total_bytes_l={self.total_bytes_l} total_bytes_r={self.total_bytes_r}",
-                            file=sys.stderr,
-                        )
-                    last_ui_print = self.t_ms
-
-                # (7) Horloge
-                self.t_ms += self.tick_ms
+        # Capacités résolues une seule fois : plus de hasattr() par tick
+        timers = [fn for fn in (getattr(left, "on_timer", None), getattr(right, "on_timer", None)) if fn is not None]
+        self._handshake_left = getattr(left, "is_handshake_complete", None)
+        self._handshake_right = getattr(right, "is_handshake_complete", None)
+        self._send_sdu_left = getattr(left, "send_sdu", None)
+        self._send_sdu_right = getattr(right, "send_sdu", None)
 
+        if self.ui_enabled:
+            self._ui_thread = threading.Thread(target=self._ui_drain, name="drybox-ui", daemon=True)
+            self._ui_thread.start()
+
+        try:
+            # Mode constant sur tout le run : une boucle spécialisée par mode
+            if self.scenario.mode == "audio":
+                self._run_audio(left, right, timers, flows_audio, duration, rtt_est)
+            else:
+                self._run_byte(left, right, timers, flows_byte, duration, rtt_est, budget_per_tick)
             return 0  # Évaluation de seuils: module dédié (à venir A1/A6)
         finally:
             # Teardown
@@ -764,8 +869,199 @@ class Runner:
                         a.stop()  # type: ignore[attr-defined]
                     except Exception:
                         pass
-            self.metrics.close()
-            self.cap.close()
+            if self._ui_thread is not None:
+                self._ui_q.put(None)  # sentinel: vide la file puis termine
+                self._ui_thread.join()
+                self._ui_thread = None
+
+    def _run_byte(
+            self,
+            left,
+            right,
+            timers: List[Callable[[int], Any]],
+            flows_byte: List[ByteFlow],
+            duration: int,
+            rtt_est: int,
+            budget_per_tick: int,
+    ) -> None:
+        """Boucle de ticks du mode A (ByteLink)."""
+        flow_l2r, flow_r2l = flows_byte
+        bearer_l2r = flow_l2r.bearer
+        bearer_r2l = flow_r2l.bearer
+        send_msgs = self._send_msg_if_handshake_is_complete
+        time_box = self._time_box
+        last_ui_print = -10_000
+        last_ui_wall_ns = -UI_MIN_WALL_NS
+
+        # fenêtres goodput (1 s) ; octets reçus cumulés sur les flux (rx_bytes)
+        window_start_ms = 0
+
+        # Track goodput for UI display
+        last_goodput_l = 0
+        last_goodput_r = 0
+
+        # Mode événementiel : tout adaptateur actif (on_timer ou poll_link_tx)
+        # sans next_tick_hint_ms() impose le pas fixe ; une réponse mise en
+        # file dans on_link_rx ne serait sinon relevée qu'au prochain indice.
+        hints: Optional[List[Callable[[int], Optional[int]]]] = None
+        if self.event_driven:
+            hints = [
+                getattr(a, "next_tick_hint_ms", None)
+                for a in (left, right)
+                if hasattr(a, "on_timer") or hasattr(a, "poll_link_tx")
+            ]
+            if any(h is None for h in hints):
+                hints = None
+        bearers = [flow.bearer for flow in flows_byte]
+        # Horloge et fenêtres en entiers locaux ; self.t_ms / time_box ne
+        # sont resynchronisés qu'une fois par tick pour les helpers et ctx.
+        tick = self.tick_ms
+        end_ms = (duration // tick + 1) * tick  # premier tick hors durée
+        write_tick_goodput = self.metrics.write_tick_goodput
+        poll_and_send = self._poll_and_send_bytemode
+        deliver_batch = self._deliver_batch_to_adapter
+        ui_enabled = self.ui_enabled
+        t_ms = self.t_ms
+
+        while t_ms <= duration:
+            delivered = False
+            # (1) Ticks avant toute I/O
+            for on_timer in timers:
+                on_timer(t_ms)
+
+            # (2) I/O et Livraison via bearer L->R R->L
+            for flow in flows_byte:
+                # Sans poll_link_tx, rien n'entre dans le bearer : flux entier sauté
+                if flow.poll_link_tx is not None:
+                    poll_and_send(flow, rtt_est, budget_per_tick)
+                    sent_ms, payloads = flow.bearer.poll_deliver_batch(t_ms)
+                    if payloads:
+                        deliver_batch(flow, sent_ms, payloads)
+                        delivered = True
+
+                send_msgs()
+
+            # (5) Goodput fenêtré (1 s)
+            if t_ms - window_start_ms >= GOODPUT_WINDOW_MS:
+                dur = t_ms - window_start_ms
+                rx_l = flow_r2l.rx_bytes  # reçu par L
+                rx_r = flow_l2r.rx_bytes  # reçu par R
+                # bps entiers : octets × 8000 / durée (ms)
+                last_goodput_l = rx_l * 8000 // dur
+                last_goodput_r = rx_r * 8000 // dur
+                if rx_l or rx_r:  # fenêtre muette : pas de ligne
+                    write_tick_goodput(t_ms, "L", LAYER_BYTELINK, last_goodput_l)
+                    write_tick_goodput(t_ms, "R", LAYER_BYTELINK, last_goodput_r)
+                flow_r2l.rx_bytes = 0
+                flow_l2r.rx_bytes = 0
+                window_start_ms = t_ms
+
+            # (6) UI minimale (stderr)
+            if (
+                ui_enabled
+                and (t_ms - last_ui_print) >= UI_PERIOD_MS
+                and (now_ns := time.monotonic_ns()) - last_ui_wall_ns >= UI_MIN_WALL_NS
+            ):
+                s_l: BearerStatsSnapshot = bearer_l2r.stats()
+                s_r: BearerStatsSnapshot = bearer_r2l.stats()
+                self._ui_emit(UI_LINE_BYTE % (
+                    t_ms,
+                    s_l.loss_rate, s_l.reorder_rate, s_l.jitter_ms,
+                    s_r.loss_rate, s_r.reorder_rate, s_r.jitter_ms,
+                    rtt_est, last_goodput_l, last_goodput_r,
+                ))
+                last_ui_print = t_ms
+                last_ui_wall_ns = now_ns
+
+            # (7) Horloge ; après une livraison, le destinataire peut avoir
+            # une réponse en file : on relève poll_link_tx au tick suivant.
+            if hints is None or delivered:
+                t_ms += tick
+            else:
+                t_ms = min(self._next_event_ms(hints, bearers, window_start_ms), end_ms)
+            self.t_ms = time_box[0] = t_ms
+
+    def _run_audio(
+            self,
+            left,
+            right,
+            timers: List[Callable[[int], Any]],
+            flows_audio: List[AudioFlow],
+            duration: int,
+            rtt_est: int,
+    ) -> None:
+        """Boucle de ticks du mode B (AudioBlock) : un bloc PCM par flux et par tick."""
+        if np is None:
+            raise SystemExit("Mode B (audio) requires numpy. Install with `pip install numpy`.")
+        send_msgs = self._send_msg_if_handshake_is_complete
+        time_box = self._time_box
+        last_ui_print = -10_000
+        last_ui_wall_ns = -UI_MIN_WALL_NS
+
+        # Track audio metrics for UI display
+        last_snr_db = 0.0
+        last_ber = 0.0
+        audio_symbols_total = 0
+        audio_symbols_lost = 0
+
+        # Liaisons figées pour tout le run (LOAD_FAST dans la boucle) ; seuls
+        # les flux dont les deux hooks existent sont traités
+        active_flows = [f for f in flows_audio if f.push_tx_block is not None and f.pull_rx_block is not None]
+        passthrough_direction = self._passthrough_audio_direction
+        process_direction = self._process_audio_direction
+        ui_enabled = self.ui_enabled
+        tick = self.tick_ms
+        t_ms = self.t_ms
+
+        while t_ms <= duration:
+            # (1) Ticks avant toute I/O
+            for on_timer in timers:
+                on_timer(t_ms)
+
+            # (2) AudioBlock
+            for flow in active_flows:
+                if flow.passthrough:
+                    if passthrough_direction(flow, rtt_est):
+                        audio_symbols_total += 1
+                    send_msgs()
+                    continue
+
+                audio_metrics = process_direction(flow, rtt_est)
+
+                send_msgs()
+
+                if audio_metrics:
+                    audio_symbols_total += 1
+                    if audio_metrics.get('snr_db') is not None:
+                        last_snr_db = audio_metrics['snr_db']
+                    if audio_metrics.get('ber') is not None:
+                        last_ber = audio_metrics['ber']
+                    if audio_metrics.get('frame_lost'):
+                        audio_symbols_lost += 1
+
+            # (6) UI minimale (stderr)
+            if (
+                ui_enabled
+                and (t_ms - last_ui_print) >= UI_PERIOD_MS
+                and (now_ns := time.monotonic_ns()) - last_ui_wall_ns >= UI_MIN_WALL_NS
+            ):
+                # Calculate PER from tracked frames
+                per_value = (audio_symbols_lost / audio_symbols_total) if audio_symbols_total > 0 else 0.0
+                total_bytes = audio_symbols_total // 8
+                total_lost_bytes = audio_symbols_lost // 8
+                
+                self._ui_emit(UI_LINE_AUDIO % (
+                    t_ms,
+                    last_snr_db, last_ber, per_value,
+                    total_bytes, total_lost_bytes,
+                    self.total_bytes_l, self.total_bytes_r,
+                ))
+                last_ui_print = t_ms
+                last_ui_wall_ns = now_ns
+
+            # (7) Horloge
+            t_ms += tick
+            self.t_ms = time_box[0] = t_ms
 
 
 # --------- CLI ----------
@@ -780,7 +1076,11 @@ def parse_args(argv: Optional[List[str]] = None):
     p.add_argument("--ui", action="store_true", default=True)
     p.add_argument("--no-ui", action="store_false", dest="ui")
     p.add_argument("--plot", action="store_true", help="Generate plots after simulation completes")
-    p.add_argument("--sweep-parallel", type=int, default=1, help="(reserved) parallelism per sweep value")
+    p.add_argument("--sweep-parallel", type=int, default=1,
+                   help="Number of sweep values run in parallel processes (default: 1 = sequential)")
+    p.add_argument("--event-driven", action="store_true",
+                   help="Byte mode: jump to the next scheduled event instead of sweeping every tick "
+                        "(adapters must implement next_tick_hint_ms)")
     return p.parse_args(argv)
 
 
@@ -801,7 +1101,56 @@ def _write_resolved_yaml(path: pathlib.Path, scen: ScenarioResolved) -> None:
         "crypto": dict(scen.crypto or {}),
     }
     with open(path, "w", encoding="utf-8") as fp:
-        yaml.safe_dump(doc, fp, sort_keys=False)
+        yaml.dump(doc, fp, Dumper=_YDumper, sort_keys=False)
+
+
+def _run_clone(
+        suffix: str,
+        scen: ScenarioResolved,
+        args: argparse.Namespace,
+        root_out: pathlib.Path,
+        keys: Optional[KeyPairs],
+) -> int:
+    """
+    Exécute un clone de sweep (scénario résolu + run).
+    Fonction de module (picklable) pour --sweep-parallel.
+    """
+    out_dir = _clone_out_dir(root_out, suffix)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Toujours écrire le scénario résolu pour chaque run
+    _write_resolved_yaml(out_dir / "scenario.resolved.yaml", scen)
+
+    runner = Runner(
+        scenario=scen,
+        left_adapter_spec=args.left,
+        right_adapter_spec=args.right,
+        out_dir=out_dir,
+        tick_ms=args.tick_ms,
+        seed=args.seed,
+        ui_enabled=args.ui,
+        preresolved_keys=keys,
+        event_driven=args.event_driven,
+    )
+    return runner.run()
+
+
+def _clone_out_dir(root_out: pathlib.Path, suffix: str) -> pathlib.Path:
+    return root_out if not suffix else root_out / suffix
+
+
+def _plot_run(out_dir: pathlib.Path) -> None:
+    """Génère les plots d'un run (process externe ; lancé depuis un thread)."""
+    try:
+        import subprocess
+        plot_cmd = [
+            sys.executable, "-m", "tools.plot_timeline",
+            str(out_dir),
+            "--type", "all"
+        ]
+        subprocess.run(plot_cmd, check=True)
+        print(f"[plot] Generated plots in: {out_dir}/plots/")
+    except Exception as e:
+        sys.stderr.write(f"[plot] Failed to generate plots: {e}\n")
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -819,38 +1168,45 @@ def main(argv: Optional[List[str]] = None) -> int:
     clones: List[Tuple[str, ScenarioResolved]] = ScenarioResolved.expand_sweep(base)
 
     root_out = pathlib.Path(args.out).resolve()
-    rc = 0
-    for suffix, scen in clones:
-        out_dir = root_out if not suffix else root_out / suffix
-        out_dir.mkdir(parents=True, exist_ok=True)
-        # Toujours écrire le scénario résolu pour chaque run
-        _write_resolved_yaml(out_dir / "scenario.resolved.yaml", scen)
-
-        runner = Runner(
-            scenario=scen,
-            left_adapter_spec=args.left,
-            right_adapter_spec=args.right,
-            out_dir=out_dir,
-            tick_ms=args.tick_ms,
-            seed=args.seed,
-            ui_enabled=args.ui,
+
+    # Les clés ne dépendent que de (crypto, seed, specs) : si le sweep ne les
+    # fait pas varier, on dérive une seule fois pour tous les clones.
+    keys: Optional[KeyPairs] = None
+    if all(s.crypto == base.crypto and s.seed == base.seed for _, s in clones):
+        keys = resolve_keypairs(
+            scenario_crypto=base.crypto,
+            seed=base.seed,
+            left_spec=args.left,
+            right_spec=args.right,
         )
-        rc = runner.run() or rc
-        
-        # Generate plots if requested
-        if args.plot:
-            try:
-                import subprocess
-                plot_cmd = [
-                    sys.executable, "-m", "tools.plot_timeline",
-                    str(out_dir),
-                    "--type", "all"
-                ]
-                subprocess.run(plot_cmd, check=True)
-                print(f"[plot] Generated plots in: {out_dir}/plots/")
-            except Exception as e:
-                sys.stderr.write(f"[plot] Failed to generate plots: {e}\n")
-    
+
+    rc = 0
+    # Plots (subprocess externes) en threads : chevauchent les runs suivants
+    plotter = ThreadPoolExecutor(max_workers=max(1, args.sweep_parallel)) if args.plot else None
+    try:
+        if args.sweep_parallel > 1 and len(clones) > 1:
+            # Clones indépendants (out_dir + RNG propres) -> un process par clone ;
+            # "spawn" : aucun état (RNG, handles) hérité du parent par fork
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=args.sweep_parallel, mp_context=ctx) as pool:
+                futures: Dict[Future, str] = {
+                    pool.submit(_run_clone, suffix, scen, args, root_out, keys): suffix
+                    for suffix, scen in clones
+                }
+                # max() : code de sortie indépendant de l'ordre de complétion
+                for fut in as_completed(futures):
+                    rc = max(rc, fut.result() or 0)
+                    if plotter is not None:
+                        plotter.submit(_plot_run, _clone_out_dir(root_out, futures[fut]))
+        else:
+            for suffix, scen in clones:
+                rc = max(rc, _run_clone(suffix, scen, args, root_out, keys) or 0)
+                if plotter is not None:
+                    plotter.submit(_plot_run, _clone_out_dir(root_out, suffix))
+    finally:
+        if plotter is not None:
+            plotter.shutdown(wait=True)
+
     return rc
 
 
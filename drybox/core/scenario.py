@@ -2,29 +2,118 @@
 # drybox/core/scenario.py — schema-based scenario validator
 from __future__ import annotations
 
+import functools
 import json
 import pathlib
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple, Union
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 try:
     import yaml  # PyYAML
 except ImportError as e:
     raise SystemExit("PyYAML is required. Install with `uv add pyyaml`") from e
 
+# Parseur/émetteur libyaml si PyYAML a été compilé avec, sinon pur Python
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+
 try:
     import jsonschema
 except ImportError as e:
     raise SystemExit("jsonschema is required. Install with `uv add jsonschema`") from e
 
+try:
+    import fastjsonschema  # optionnel : validateur compilé en code Python
+except ImportError:
+    fastjsonschema = None
+
 from drybox.core.paths import resolve_resource_path, SCENARIOS_DIR
 
 
+# Valeurs par défaut de premier niveau ; from_yaml recopie chaque sous-dict,
+# ces objets ne sont donc jamais exposés ni modifiés
+_SCENARIO_DEFAULTS: Dict[str, Any] = {
+    "mode": "audio",
+    "duration_ms": 2500,
+    "seed": 123456,
+    "cfo_hz": 0,
+    "ppm": 0,
+    "network": {"bearer": "volte_evs"},
+    "left": {"adapter": "nade-python", "gain": 1.0},
+    "right": {"adapter": "nade-python", "gain": 1.0},
+}
+
+
 class ScenarioValidationError(Exception):
     """Raised when the scenario YAML fails schema validation."""
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _get_validator() -> Any:
+    """Validateur jsonschema du schéma scénario (méta-schéma vérifié une fois)."""
+    schema = ScenarioResolved._load_schema()
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fast_validate() -> Optional[Callable[[Any], Any]]:
+    """
+    Fonction de validation générée par fastjsonschema (None si absent ou si
+    le schéma n'est pas compilable). Sans défauts ni formats : même
+    périmètre que jsonschema, document non modifié.
+    """
+    if fastjsonschema is None:
+        return None
+    _get_validator()  # check_schema() toujours effectué une fois
+    try:
+        return fastjsonschema.compile(
+            ScenarioResolved._load_schema(),
+            use_default=False,
+            use_formats=False,
+            detailed_exceptions=False,
+        )
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+def _passes_fast_validation(doc: Dict[str, Any]) -> bool:
+    """True si le validateur compilé accepte `doc` ; False s'il le rejette ou manque."""
+    validate = _get_fast_validate()
+    if validate is None:
+        return False
+    try:
+        validate(doc)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
+
+
+def _snr_suffix_int(v: Union[int, float]) -> str:
+    return f"snr_{int(v)}"
+
+
+def _snr_suffix(v: Any) -> str:
+    return f"snr_{int(v) if isinstance(v, (int, float)) and v == int(v) else v}"
+
+
+def _read_text_if_file(path: pathlib.Path) -> Optional[str]:
+    """Contenu de `path` s'il s'agit d'un fichier, sinon None (un seul open, pas de stat)."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    except PermissionError:
+        # Windows : ouvrir un répertoire lève PermissionError
+        if path.is_dir():
+            return None
+        raise
+
+
+@dataclass(slots=True)
 class ScenarioResolved:
     mode: str
     duration_ms: int
@@ -43,11 +132,15 @@ class ScenarioResolved:
         p = pathlib.Path(path_or_name)
 
         # 1. Direct file path
-        if p.exists() and p.is_file():
-            return p.read_text(encoding="utf-8")
+        text = _read_text_if_file(p)
+        if text is not None:
+            return text
 
-        # 2. Try as scenario name in scenarios directory
+        # 2. Try as scenario name in scenarios directory (package resources ensuite)
         name = p.name
+        text = _read_text_if_file(SCENARIOS_DIR / name)
+        if text is not None:
+            return text
         scenario_path = resolve_resource_path("scenarios", name)
         if scenario_path and scenario_path.is_file():
             return scenario_path.read_text(encoding="utf-8")
@@ -65,7 +158,9 @@ class ScenarioResolved:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _load_schema() -> Dict[str, Any]:
+        # Lu une seule fois par process (sweeps : un chargement par clone sinon)
         schema_path = resolve_resource_path("schema", "scenario.schema.json")
         if schema_path:
             return json.loads(schema_path.read_text(encoding="utf-8"))
@@ -73,33 +168,39 @@ class ScenarioResolved:
 
     @staticmethod
     def _apply_defaults(doc: Dict[str, Any]) -> Dict[str, Any]:
-        out = dict(doc) if doc else {}
-        out.setdefault("mode", "audio")
-        out.setdefault("duration_ms", 2500)
-        out.setdefault("seed", 123456)
-        out.setdefault("cfo_hz", 0)
-        out.setdefault("ppm", 0)
-        out.setdefault("network", {"bearer": "volte_evs"})
-        out.setdefault("left", {"adapter": "nade-python", "gain": 1.0})
-        out.setdefault("right", {"adapter": "nade-python", "gain": 1.0})
-        return out
+        # Une fusion en C ; les clés présentes dans doc l'emportent
+        return {**_SCENARIO_DEFAULTS, **doc} if doc else dict(_SCENARIO_DEFAULTS)
 
     # ---------- Loading & validation ----------
 
     @classmethod
     def from_yaml(cls, path: Union[str, pathlib.Path]) -> "ScenarioResolved":
         yaml_text = cls._resolve_scenario_text(path)
-        raw = yaml.safe_load(yaml_text) or {}
+        return cls.from_yaml_dict(yaml.load(yaml_text, Loader=_YLoader) or {})
+
+    @classmethod
+    def from_yaml_dict(cls, raw: Dict[str, Any], *, trusted: bool = False) -> "ScenarioResolved":
+        """
+        Construit un scénario depuis un dict déjà chargé (défauts + validation).
+        trusted=True saute la validation : réservé aux dicts produits par le
+        programme à partir d'un scénario déjà validé (ex. to_resolved_dict()).
+        """
         if not isinstance(raw, dict):
             raise ScenarioValidationError("Scenario YAML must define a mapping at top level")
 
         doc = cls._apply_defaults(raw)
-        schema = cls._load_schema()
-        try:
-            jsonschema.validate(instance=doc, schema=schema)
-        except jsonschema.ValidationError as e:
-            raise ScenarioValidationError(str(e)) from e
+        # Chemin rapide compilé ; sinon (ou en cas de rejet) jsonschema, pour
+        # la même erreur que jsonschema.validate (best_match)
+        if not trusted and not _passes_fast_validation(doc):
+            error = jsonschema.exceptions.best_match(_get_validator().iter_errors(doc))
+            if error is not None:
+                raise ScenarioValidationError(str(error)) from error
 
+        return cls._build_unchecked(doc)
+
+    @classmethod
+    def _build_unchecked(cls, doc: Dict[str, Any]) -> "ScenarioResolved":
+        # doc complet (défauts appliqués) et supposé valide
         return cls(
             mode=str(doc["mode"]),
             duration_ms=int(doc["duration_ms"]),
@@ -118,22 +219,18 @@ class ScenarioResolved:
         snr = self.left.get("modem", {}).get("snr_db")
         if isinstance(snr, list) and snr:
             clones: List[Tuple[str, ScenarioResolved]] = []
+            modem = self.left.get("modem", {})
+            # Formateur choisi une fois pour la liste : valeurs toutes entières
+            # (cas courant) -> int direct, sinon test par valeur
+            if all(type(v) is int or (type(v) is float and v.is_integer()) for v in snr):
+                fmt = _snr_suffix_int
+            else:
+                fmt = _snr_suffix
             for v in snr:
-                clone_left = dict(self.left)
-                clone_left["modem"] = dict(clone_left.get("modem", {}), snr_db=v)
-                clone = ScenarioResolved(
-                    mode=self.mode,
-                    duration_ms=self.duration_ms,
-                    seed=self.seed,
-                    network=dict(self.network),
-                    left=clone_left,
-                    right=dict(self.right),
-                    cfo_hz=self.cfo_hz,
-                    ppm=self.ppm,
-                    crypto=dict(self.crypto),
-                )
-                suffix = f"snr_{int(v) if isinstance(v, (int, float)) and v == int(v) else v}"
-                clones.append((suffix, clone))
+                # Seul left.modem.snr_db varie : network/right/crypto sont
+                # partagés avec la base (lus seulement en aval)
+                clone = replace(self, left={**self.left, "modem": {**modem, "snr_db": v}})
+                clones.append((fmt(v), clone))
             return clones
         return [("", self)]
 
@@ -156,4 +253,4 @@ class ScenarioResolved:
         p = pathlib.Path(out_path)
         p.parent.mkdir(parents=True, exist_ok=True)
         with open(p, "w", encoding="utf-8") as fp:
-            yaml.safe_dump(self.to_resolved_dict(), fp, sort_keys=False)
+            yaml.dump(self.to_resolved_dict(), fp, Dumper=_YDumper, sort_keys=False)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import bisect
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout,
-    QComboBox, QDoubleSpinBox, QCheckBox, QSpinBox, QSizePolicy
+    QComboBox, QDoubleSpinBox, QCheckBox, QSizePolicy
 )
 
 from drybox.core.adapter_registry import (
@@ -14,42 +17,109 @@ from drybox.core.adapter_registry import (
     resolve_identifier,
 )
 from drybox.core.paths import ADAPTERS_DIR
+from drybox.gui.utils.helpers import make_spin_box
 
 DEFAULT_IDENTIFIER = "nade-python"
 
+# Découverte (glob + entry points) faite une fois par répertoire d'adaptateurs
+_DISCOVERY_CACHE: Dict[Path, List[AdapterInfo]] = {}
+
+
+VOCODERS = ("amr12k2_mock", "evs13k2_mock", "opus_nb_mock")
+CHANNELS = ("awgn", "fading")
+
+# Formulaire modem : (clé, libellé, type, config) ; combo -> items,
+# check -> texte, spin -> (min, max, défaut)
+_MODEM_SPEC: Tuple[Tuple[str, str, str, Any], ...] = (
+    ("vocoder", "Vocoder:", "combo", VOCODERS),
+    ("vad_dtx", "", "check", "Enable VAD/DTX"),
+    ("channel_type", "Channel:", "combo", CHANNELS),
+    ("snr_db", "SNR (dB):", "spin", (0, 50, 20)),
+    ("doppler_hz", "Max Doppler freq (Hz):", "spin", (0, 10000, 50)),
+    ("num_paths", "Multipath components:", "spin", (1, 100, 8)),
+)
+
+
+def _build_modem_widget(kind: str, cfg: Any):
+    """Return (widget, reader, setter, change signal) for one _MODEM_SPEC entry."""
+    if kind == "combo":
+        w = QComboBox()
+        w.addItems(list(cfg))
+        return w, w.currentText, w.setCurrentText, w.currentTextChanged
+    if kind == "check":
+        w = QCheckBox(cfg)
+        return w, w.isChecked, lambda value: w.setChecked(bool(value)), w.toggled
+    w = make_spin_box(*cfg)
+    return w, w.value, w.setValue, w.valueChanged
+
+
+def _adapter_sort_key(info: AdapterInfo) -> Tuple[int, str]:
+    """Local adapters first, then entry points, alphabetically (same order as discover_adapters)."""
+    return (0 if info.source == "file" else 1, info.display_name.lower())
+
+
+def _discover_adapters_cached(adapters_dir: Path) -> List[AdapterInfo]:
+    infos = _DISCOVERY_CACHE.get(adapters_dir)
+    if infos is None:
+        infos = _DISCOVERY_CACHE[adapters_dir] = discover_adapters(adapters_dir)
+    # Copie : les identifiants "(missing)" ajoutés par une page restent locaux
+    return list(infos)
+
 
 class AdaptersPage(QWidget):
     def __init__(self, adapters_dir: Optional[Path] = None):
         super().__init__()
-        self.adapters_dir = (adapters_dir or ADAPTERS_DIR).resolve()
-        self.adapter_infos = discover_adapters(self.adapters_dir)
+        # ADAPTERS_DIR dérive d'un chemin déjà résolu : seul un répertoire fourni l'est
+        self.adapters_dir = adapters_dir.resolve() if adapters_dir else ADAPTERS_DIR
+        self.adapter_infos = _discover_adapters_cached(self.adapters_dir)
         self._adapter_index: Dict[str, AdapterInfo] = {
             info.identifier: info for info in self.adapter_infos
         }
 
         layout = QHBoxLayout(self)
 
-        self.left_box, self.left_adapter_combo, self.left_gain, self.left_modem_widgets = \
-            self._create_adapter_box("Left Adapter")
+        # to_dict() mis en cache ; les signaux des widgets l'invalident
+        self._dict_cache: Optional[Tuple[dict, dict]] = None
+
+        (self.left_box, self.left_adapter_combo, self.left_gain,
+         self.left_modem_widgets, self.left_modem_readers,
+         self.left_modem_setters) = self._create_adapter_box("Left Adapter")
         layout.addWidget(self.left_box)
 
-        self.right_box, self.right_adapter_combo, self.right_gain, self.right_modem_widgets = \
-            self._create_adapter_box("Right Adapter")
+        (self.right_box, self.right_adapter_combo, self.right_gain,
+         self.right_modem_widgets, self.right_modem_readers,
+         self.right_modem_setters) = self._create_adapter_box("Right Adapter")
         layout.addWidget(self.right_box)
 
+        # Un seul modèle d'items partagé par les deux combos (sélection propre à chacun)
+        self._adapter_model = QStandardItemModel(self)
+        for combo in (self.left_adapter_combo, self.right_adapter_combo):
+            combo.setModel(self._adapter_model)
+
         self._refresh_combo_items()
 
     # === Discovery helpers ===
+    @staticmethod
+    def _make_item(info: AdapterInfo) -> QStandardItem:
+        item = QStandardItem(info.display_name)
+        item.setData(info.identifier, Qt.UserRole)  # lu par currentData()/findData()
+        return item
+
     def _refresh_combo_items(self) -> None:
         """Populate both combo boxes with the currently known adapters."""
-        for combo in (self.left_adapter_combo, self.right_adapter_combo):
-            selected_id = combo.currentData()
+        combos = (self.left_adapter_combo, self.right_adapter_combo)
+        selected_ids = [combo.currentData() for combo in combos]
+        for combo in combos:
             combo.blockSignals(True)
-            combo.clear()
-            for info in self.adapter_infos:
-                combo.addItem(info.display_name, info.identifier)
+        # Remplissage en bloc du modèle partagé : une seule mise à jour des vues
+        self._adapter_model.clear()
+        if self.adapter_infos:
+            self._adapter_model.appendColumn([self._make_item(info) for info in self.adapter_infos])
+        for combo, selected_id in zip(combos, selected_ids):
             combo.blockSignals(False)
             self._set_combo_to_identifier(combo, selected_id or DEFAULT_IDENTIFIER)
+        # Changements faits signaux bloqués : invalidation explicite
+        self._invalidate_dict()
 
     def _ensure_adapter_identifier(self, identifier: str) -> AdapterInfo:
         if not identifier:
@@ -68,10 +138,20 @@ class AdaptersPage(QWidget):
                 source=source,
                 metadata={"missing": "true"},
             )
-        self.adapter_infos.append(resolved)
-        self.adapter_infos.sort(key=lambda info: (0 if info.source == "file" else 1, info.display_name.lower()))
+        # Insertion à sa place (liste déjà triée) et dans les combos, sans
+        # les repeupler
+        idx = bisect.bisect_right(self.adapter_infos, _adapter_sort_key(resolved), key=_adapter_sort_key)
+        self.adapter_infos.insert(idx, resolved)
         self._adapter_index[identifier] = resolved
-        self._refresh_combo_items()
+        combos = (self.left_adapter_combo, self.right_adapter_combo)
+        was_empty = self._adapter_model.rowCount() == 0
+        for combo in combos:
+            combo.blockSignals(True)
+        self._adapter_model.insertRow(idx, self._make_item(resolved))  # visible dans les deux combos
+        for combo in combos:
+            combo.blockSignals(False)
+            if was_empty:
+                self._set_combo_to_identifier(combo, DEFAULT_IDENTIFIER)
         return resolved
 
     def _info_for_identifier(self, identifier: Optional[str]) -> AdapterInfo:
@@ -95,11 +175,7 @@ class AdaptersPage(QWidget):
         combo = QComboBox()
         form.addRow("Adapter:", combo)
 
-        gain = QDoubleSpinBox()
-        gain.setRange(0.0, 10.0)
-        gain.setSingleStep(0.1)
-        gain.setDecimals(2)
-        gain.setValue(1.00)
+        gain = make_spin_box(0.0, 10.0, 1.00, step=0.1, decimals=2)
         form.addRow("Gain:", gain)
 
         v_layout.addLayout(form)
@@ -107,49 +183,30 @@ class AdaptersPage(QWidget):
         modem_box = QGroupBox("Modem")
         modem_layout = QFormLayout(modem_box)
 
-        vocoder_combo = QComboBox()
-        vocoder_combo.addItems(["amr12k2_mock", "evs13k2_mock", "opus_nb_mock"])
-        modem_layout.addRow("Vocoder:", vocoder_combo)
-
-        vad_checkbox = QCheckBox("Enable VAD/DTX")
-        modem_layout.addRow("", vad_checkbox)
-
-        channel_combo = QComboBox()
-        channel_combo.addItems(["awgn", "fading"])
-        modem_layout.addRow("Channel:", channel_combo)
-
-        snr_spin = QSpinBox()
-        snr_spin.setRange(0, 50)
-        snr_spin.setSingleStep(1)
-        snr_spin.setValue(20)
-        modem_layout.addRow("SNR (dB):", snr_spin)
-
-        doppler_spin = QSpinBox()
-        doppler_spin.setRange(0, 10000)
-        doppler_spin.setSingleStep(1)
-        doppler_spin.setValue(50)
-        modem_layout.addRow("Max Doppler freq (Hz):", doppler_spin)
-
-        num_paths_spin = QSpinBox()
-        num_paths_spin.setRange(1, 100)
-        num_paths_spin.setSingleStep(1)
-        num_paths_spin.setValue(8)
-        modem_layout.addRow("Multipath components:", num_paths_spin)
+        # Widgets, lecteurs et setters du formulaire modem, construits depuis
+        # _MODEM_SPEC en une passe
+        modem_widgets: Dict[str, QWidget] = {}
+        modem_readers: Dict[str, Callable[[], Any]] = {}
+        modem_setters: Dict[str, Callable[[Any], None]] = {}
+        for key, label, kind, cfg in _MODEM_SPEC:
+            widget, read, write, changed = _build_modem_widget(kind, cfg)
+            modem_layout.addRow(label, widget)
+            changed.connect(self._invalidate_dict)
+            modem_widgets[key] = widget
+            modem_readers[key] = read
+            modem_setters[key] = write
 
         modem_box.setLayout(modem_layout)
         v_layout.addWidget(modem_box)
         box.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
 
-        modem_widgets = {
-            "vocoder": vocoder_combo,
-            "vad_dtx": vad_checkbox,
-            "channel_type": channel_combo,
-            "snr_db": snr_spin,
-            "doppler_hz": doppler_spin,
-            "num_paths": num_paths_spin,
-        }
+        combo.currentIndexChanged.connect(self._invalidate_dict)
+        gain.valueChanged.connect(self._invalidate_dict)
+
+        return box, combo, gain, modem_widgets, modem_readers, modem_setters
 
-        return box, combo, gain, modem_widgets
+    def _invalidate_dict(self, *_):
+        self._dict_cache = None
 
     # === Scenario support ===
     def set_from_scenario(self, left: dict, right: dict):
@@ -159,47 +216,45 @@ class AdaptersPage(QWidget):
         self._ensure_adapter_identifier(left_id)
         self._ensure_adapter_identifier(right_id)
 
-        self._set_combo_to_identifier(self.left_adapter_combo, left_id)
-        self._set_combo_to_identifier(self.right_adapter_combo, right_id)
-
-        self.left_gain.setValue(float(left.get("gain", 1.0)))
-        self.right_gain.setValue(float(right.get("gain", 1.0)))
-
-        for widgets, config in ((self.left_modem_widgets, left.get("modem", {})),
-                                (self.right_modem_widgets, right.get("modem", {}))):
-            for key, widget in widgets.items():
-                if key not in config:
-                    continue
-                value = config[key]
-                if isinstance(widget, QCheckBox):
-                    widget.setChecked(bool(value))
-                elif hasattr(widget, "setValue"):
-                    widget.setValue(value)  # type: ignore[arg-type]
-                else:
-                    widget.setCurrentText(value)
+        # Signaux bloqués le temps du remplissage (après _ensure_adapter_identifier,
+        # qui gère les siens) ; une seule invalidation à la fin
+        blocked = [self.left_adapter_combo, self.right_adapter_combo, self.left_gain, self.right_gain]
+        for widgets in (self.left_modem_widgets, self.right_modem_widgets):
+            blocked.extend(widgets.values())
+        for w in blocked:
+            w.blockSignals(True)
+        try:
+            self._set_combo_to_identifier(self.left_adapter_combo, left_id)
+            self._set_combo_to_identifier(self.right_adapter_combo, right_id)
+
+            self.left_gain.setValue(float(left.get("gain", 1.0)))
+            self.right_gain.setValue(float(right.get("gain", 1.0)))
+
+            for setters, config in ((self.left_modem_setters, left.get("modem", {})),
+                                    (self.right_modem_setters, right.get("modem", {}))):
+                for key, set_value in setters.items():
+                    if key in config:
+                        set_value(config[key])
+        finally:
+            for w in blocked:
+                w.blockSignals(False)
+            self._invalidate_dict()
+
+    def _serialize_side(self, combo: QComboBox, gain_widget: QDoubleSpinBox, modem_readers: dict) -> dict:
+        adapter_info = self._info_for_identifier(combo.currentData())
+        return {
+            "adapter": adapter_info.identifier,
+            "gain": gain_widget.value(),  # déjà arrondi à setDecimals() par Qt
+            "modem": {key: read() for key, read in modem_readers.items()},
+        }
 
     def to_dict(self) -> Tuple[dict, dict]:
-        left_adapter_id = self.left_adapter_combo.currentData()
-        right_adapter_id = self.right_adapter_combo.currentData()
-
-        def serialize(combo_id, gain_widget, modem_widgets):
-            adapter_info = self._info_for_identifier(combo_id)
-            return {
-                "adapter": adapter_info.identifier,
-                "gain": round(gain_widget.value(), 3),
-                "modem": {
-                    key: (
-                        widget.isChecked() if isinstance(widget, QCheckBox)
-                        else (round(widget.value(), 3) if isinstance(widget, QDoubleSpinBox)
-                              else (widget.value() if hasattr(widget, "value") else widget.currentText()))
-                    )
-                    for key, widget in modem_widgets.items()
-                },
-            }
-
-        left = serialize(left_adapter_id, self.left_gain, self.left_modem_widgets)
-        right = serialize(right_adapter_id, self.right_gain, self.right_modem_widgets)
-        return left, right
+        """(left, right), partagés tant qu'aucun widget ne change : ne pas les modifier."""
+        if self._dict_cache is None:
+            left = self._serialize_side(self.left_adapter_combo, self.left_gain, self.left_modem_readers)
+            right = self._serialize_side(self.right_adapter_combo, self.right_gain, self.right_modem_readers)
+            self._dict_cache = (left, right)
+        return self._dict_cache
 
     # === Runner integration ===
     def get_selected_adapter_infos(self) -> Tuple[AdapterInfo, AdapterInfo]:
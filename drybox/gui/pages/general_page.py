@@ -1,10 +1,25 @@
-import random
+import functools
+import re
+from PySide6.QtCore import QRandomGenerator
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QFormLayout,
-    QSpinBox, QDoubleSpinBox, QComboBox, QPushButton, 
-    QRadioButton, QButtonGroup, QTextEdit
+    QComboBox, QPushButton,
+    QRadioButton, QButtonGroup, QPlainTextEdit
 )
 
+from drybox.gui.utils.helpers import make_spin_box
+
+BEARERS = ("volte_evs", "cs_gsm", "pstn_g711", "ott_udp")
+
+# "+TIME_MS Message" : délai tel que l'accepte int() (signe, "_", blancs hors
+# espace), premier espace séparateur, texte non vide
+_MSG_RE = re.compile(r"\+[^\S ]*([+-]?\d+(?:_\d+)*)[^\S ]* \s*(\S.*)")
+
+
+def _random_seed() -> int:
+    # Même plage que l'ancien random.randint(0, 999999), via le générateur Qt
+    return QRandomGenerator.global_().bounded(1000000)
+
 
 class GeneralPage(QWidget):
     def __init__(self):
@@ -33,16 +48,11 @@ class GeneralPage(QWidget):
         basic_layout.addRow("Mode:", mode_widget)
 
         # Duration
-        self.duration_spin = QSpinBox()
-        self.duration_spin.setRange(0, 50000)
-        self.duration_spin.setSingleStep(100)
-        self.duration_spin.setValue(2500)
+        self.duration_spin = make_spin_box(0, 50000, 2500, step=100)
         basic_layout.addRow("Duration (ms):", self.duration_spin)
 
         # Seed
-        self.seed_spin = QSpinBox()
-        self.seed_spin.setRange(0, 999999)
-        self.seed_spin.setValue(random.randint(0, 999999))
+        self.seed_spin = make_spin_box(0, 999999, _random_seed())
         seed_widget = QWidget()
         seed_layout = QHBoxLayout(seed_widget)
         seed_layout.setContentsMargins(0, 0, 0, 0)
@@ -50,58 +60,36 @@ class GeneralPage(QWidget):
         self.seed_button = QPushButton("Random")
         seed_layout.addWidget(self.seed_button)
         basic_layout.addRow("Seed:", seed_widget)
-        self.seed_button.clicked.connect(lambda: self.seed_spin.setValue(random.randint(0, 999999)))
+        self.seed_button.clicked.connect(self._randomize_seed)
 
         # --- Network box ---
         network_box = QGroupBox("Network")
         network_layout = QFormLayout(network_box)
 
         self.bearer_combo = QComboBox()
-        self.bearer_combo.addItems(["volte_evs", "cs_gsm", "pstn_g711", "ott_udp"])
+        self.bearer_combo.addItems(list(BEARERS))
         network_layout.addRow("Bearer:", self.bearer_combo)
 
-        self.loss_spin = QDoubleSpinBox()
-        self.loss_spin.setRange(0.0, 1.0)
-        self.loss_spin.setSingleStep(0.01)
-        self.loss_spin.setDecimals(3)
-        self.loss_spin.setValue(0.0)
+        self.loss_spin = make_spin_box(0.0, 1.0, 0.0, step=0.01, decimals=3)
         network_layout.addRow("Loss rate:", self.loss_spin)
 
         # Advanced network options
-        self.latency_spin = QSpinBox()
-        self.latency_spin.setRange(0, 1000)
-        self.latency_spin.setValue(20)
+        self.latency_spin = make_spin_box(0, 1000, 20)
         network_layout.addRow("Latency (ms):", self.latency_spin)
 
-        self.jitter_spin = QSpinBox()
-        self.jitter_spin.setRange(0, 500)
-        self.jitter_spin.setValue(5)
+        self.jitter_spin = make_spin_box(0, 500, 5)
         network_layout.addRow("Jitter (ms):", self.jitter_spin)
 
-        self.reorder_spin = QDoubleSpinBox()
-        self.reorder_spin.setRange(0.0, 1.0)
-        self.reorder_spin.setSingleStep(0.01)
-        self.reorder_spin.setDecimals(3)
-        self.reorder_spin.setValue(0.0)
+        self.reorder_spin = make_spin_box(0.0, 1.0, 0.0, step=0.01, decimals=3)
         network_layout.addRow("Reorder rate:", self.reorder_spin)
 
-        self.ge_good_bad_spin = QDoubleSpinBox()
-        self.ge_good_bad_spin.setRange(0.0, 1.0)
-        self.ge_good_bad_spin.setSingleStep(0.001)
-        self.ge_good_bad_spin.setDecimals(4)
-        self.ge_good_bad_spin.setValue(0.001)
+        self.ge_good_bad_spin = make_spin_box(0.0, 1.0, 0.001, step=0.001, decimals=4)
         network_layout.addRow("SAR P good→bad:", self.ge_good_bad_spin)
 
-        self.ge_bad_good_spin = QDoubleSpinBox()
-        self.ge_bad_good_spin.setRange(0.0, 1.0)
-        self.ge_bad_good_spin.setSingleStep(0.001)
-        self.ge_bad_good_spin.setDecimals(4)
-        self.ge_bad_good_spin.setValue(0.1)
+        self.ge_bad_good_spin = make_spin_box(0.0, 1.0, 0.1, step=0.001, decimals=4)
         network_layout.addRow("SAR P bad→good:", self.ge_bad_good_spin)
 
-        self.mtu_spin = QSpinBox()
-        self.mtu_spin.setRange(16, 10000)
-        self.mtu_spin.setValue(1500)
+        self.mtu_spin = make_spin_box(16, 10000, 1500)
         network_layout.addRow("MTU bytes:", self.mtu_spin)
 
         # --- Messages Left Adapter box ---
@@ -109,7 +97,7 @@ class GeneralPage(QWidget):
         messages_left_box.setTitle("Messages Left Adapter   (format: +TIME_MS Message)")
         messages_left_layout = QVBoxLayout(messages_left_box)
         
-        self.messages_left_text = QTextEdit()
+        self.messages_left_text = QPlainTextEdit()
         self.messages_left_text.setMinimumHeight(150)
         self.messages_left_text.setPlainText("+0 Hello from L\n+300 Test message from Left\n+900 Final message L")
         
@@ -120,7 +108,7 @@ class GeneralPage(QWidget):
         messages_right_box.setTitle("Messages Right Adapter   (format: +TIME_MS Message)")
         messages_right_layout = QVBoxLayout(messages_right_box)
         
-        self.messages_right_text = QTextEdit()
+        self.messages_right_text = QPlainTextEdit()
         self.messages_right_text.setMinimumHeight(150)
         self.messages_right_text.setPlainText("+0 Hello from R\n+600 Test message from Right\n+1100 Final message R")
         
@@ -136,123 +124,141 @@ class GeneralPage(QWidget):
         layout.addLayout(left_column, 1)
         layout.addLayout(right_column, 1)
 
+        # to_dict() mis en cache ; tout changement de champ l'invalide
+        self._dict_cache = None
+        self._spins = (self.duration_spin, self.seed_spin, self.loss_spin, self.latency_spin,
+                       self.jitter_spin, self.reorder_spin, self.ge_good_bad_spin,
+                       self.ge_bad_good_spin, self.mtu_spin)
+        self.mode_byte.toggled.connect(self._invalidate_dict)
+        self.bearer_combo.currentTextChanged.connect(self._invalidate_dict)
+        for spin in self._spins:
+            spin.valueChanged.connect(self._invalidate_dict)
+        self.messages_left_text.textChanged.connect(self._invalidate_dict)
+        self.messages_right_text.textChanged.connect(self._invalidate_dict)
+
+        # Messages d'un scénario chargé, rendus tels quels tant que le texte
+        # n'est pas édité (évite le reparse du texte qu'on vient de formater)
+        self._messages_cache = {}
+        for side, edit in (("left", self.messages_left_text), ("right", self.messages_right_text)):
+            edit.textChanged.connect(functools.partial(self._messages_cache.pop, side, None))
+
+    def _invalidate_dict(self, *_):
+        self._dict_cache = None
+
+    def _randomize_seed(self, *_):
+        self.seed_spin.setValue(_random_seed())
+
     # === Message helpers ===
-    def get_messages_left(self):
-        """Get list of timed messages for left adapter.
-        Returns list of dicts: [{"delay_ms": 0, "text": "Hello"}, ...]
+    @staticmethod
+    def _parse_messages(text: str):
+        """Parse "+TIME_MS Message" lines into [{"delay_ms": 0, "text": "Hello"}, ...].
+        Lines without a "+" prefix default to +0; malformed timed lines are skipped.
         """
-        text = self.messages_left_text.toPlainText().strip()
-        if not text:
-            return []
-        
         messages = []
-        for line in text.split('\n'):
+        for line in text.splitlines():
             line = line.strip()
             if not line:
                 continue
-            
-            # Parse format: +TIME_MS Message text
-            if line.startswith('+'):
-                try:
-                    # Find space after time
-                    space_idx = line.find(' ')
-                    if space_idx > 0:
-                        delay_ms = int(line[1:space_idx])
-                        msg_text = line[space_idx+1:].strip()
-                        if msg_text:
-                            messages.append({"delay_ms": delay_ms, "text": msg_text})
-                except ValueError:
-                    # Invalid format, skip this line
-                    continue
-            else:
-                # No timing specified, default to +0
+            if line[0] != '+':
                 messages.append({"delay_ms": 0, "text": line})
-        
+                continue
+            m = _MSG_RE.fullmatch(line)
+            if m:
+                messages.append({"delay_ms": int(m.group(1)), "text": m.group(2)})
         return messages
-    
-    def get_messages_right(self):
-        """Get list of timed messages for right adapter.
-        Returns list of dicts: [{"delay_ms": 0, "text": "Hello"}, ...]
+
+    @staticmethod
+    def _format_messages(messages):
+        """Format messages as "+TIME_MS Message" text.
+        Also returns the list _parse_messages() would read back from that text,
+        or None when a message does not round-trip unchanged.
         """
-        text = self.messages_right_text.toPlainText().strip()
-        if not text:
-            return []
-        
-        messages = []
-        for line in text.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            
-            if line.startswith('+'):
-                try:
-                    space_idx = line.find(' ')
-                    if space_idx > 0:
-                        delay_ms = int(line[1:space_idx])
-                        msg_text = line[space_idx+1:].strip()
-                        if msg_text:
-                            messages.append({"delay_ms": delay_ms, "text": msg_text})
-                except ValueError:
+        lines = []
+        parsed = []
+        for msg in messages:
+            if isinstance(msg, dict):
+                delay = msg.get("delay_ms", 0)
+                text = msg.get("text", "")
+                lines.append(f"+{delay} {text}")
+                if (parsed is not None and type(delay) is int and type(text) is str
+                        and text and text.isprintable() and text.strip() == text):
+                    parsed.append({"delay_ms": delay, "text": text})
                     continue
             else:
-                messages.append({"delay_ms": 0, "text": line})
-        
-        return messages
+                lines.append(str(msg))
+            parsed = None
+        return '\n'.join(lines), parsed
+
+    def get_messages_left(self):
+        """Get list of timed messages for left adapter."""
+        cached = self._messages_cache.get("left")
+        if cached is not None:
+            return cached
+        return self._parse_messages(self.messages_left_text.toPlainText())
+
+    def get_messages_right(self):
+        """Get list of timed messages for right adapter."""
+        cached = self._messages_cache.get("right")
+        if cached is not None:
+            return cached
+        return self._parse_messages(self.messages_right_text.toPlainText())
 
     # === Scenario support ===
     def set_from_scenario(self, scenario: dict):
-        mode = scenario.get("mode", "audio")
-        self.mode_byte.setChecked(mode.lower().startswith("byte"))
-        self.mode_audio.setChecked(not mode.lower().startswith("byte"))
-        self.duration_spin.setValue(scenario.get("duration_ms", 1000))
-        self.seed_spin.setValue(scenario.get("seed", random.randint(0, 999999)))
-
-        network = scenario.get("network", {})
-        self.bearer_combo.setCurrentText(network.get("bearer", "volte_evs"))
-        self.loss_spin.setValue(network.get("loss_rate", 0.0))
-        self.latency_spin.setValue(network.get("latency_ms", 20))
-        self.jitter_spin.setValue(network.get("jitter_ms", 5))
-        self.reorder_spin.setValue(network.get("reorder_rate", 0.0))
-        self.ge_good_bad_spin.setValue(network.get("ge_p_good_bad", 0.001))
-        self.ge_bad_good_spin.setValue(network.get("ge_p_bad_good", 0.1))
-        self.mtu_spin.setValue(network.get("mtu_bytes", 1500))
-        
+        # Champs remplis signaux bloqués (un seul slot branché : l'invalidation,
+        # faite une fois à la fin)
+        blocked = (self.mode_byte, self.mode_audio, self.bearer_combo) + self._spins
+        for w in blocked:
+            w.blockSignals(True)
+        try:
+            mode = scenario.get("mode", "audio")
+            self.mode_byte.setChecked(mode.lower().startswith("byte"))
+            self.mode_audio.setChecked(not mode.lower().startswith("byte"))
+            self.duration_spin.setValue(scenario.get("duration_ms", 1000))
+            self.seed_spin.setValue(scenario["seed"] if "seed" in scenario else _random_seed())
+
+            network = scenario.get("network", {})
+            self.bearer_combo.setCurrentText(network.get("bearer", "volte_evs"))
+            self.loss_spin.setValue(network.get("loss_rate", 0.0))
+            self.latency_spin.setValue(network.get("latency_ms", 20))
+            self.jitter_spin.setValue(network.get("jitter_ms", 5))
+            self.reorder_spin.setValue(network.get("reorder_rate", 0.0))
+            self.ge_good_bad_spin.setValue(network.get("ge_p_good_bad", 0.001))
+            self.ge_bad_good_spin.setValue(network.get("ge_p_bad_good", 0.1))
+            self.mtu_spin.setValue(network.get("mtu_bytes", 1500))
+        finally:
+            for w in blocked:
+                w.blockSignals(False)
+            self._invalidate_dict()
+
         messages = scenario.get("messages", {})
-        if "left" in messages:
-            lines = []
-            for msg in messages["left"]:
-                if isinstance(msg, dict):
-                    delay = msg.get("delay_ms", 0)
-                    text = msg.get("text", "")
-                    lines.append(f"+{delay} {text}")
-                else:
-                    lines.append(str(msg))
-            self.messages_left_text.setPlainText('\n'.join(lines))
-        if "right" in messages:
-            lines = []
-            for msg in messages["right"]:
-                if isinstance(msg, dict):
-                    delay = msg.get("delay_ms", 0)
-                    text = msg.get("text", "")
-                    lines.append(f"+{delay} {text}")
-                else:
-                    lines.append(str(msg))
-            self.messages_right_text.setPlainText('\n'.join(lines))
+        for side, edit in (("left", self.messages_left_text), ("right", self.messages_right_text)):
+            if side in messages:
+                text, parsed = self._format_messages(messages[side])
+                edit.setPlainText(text)  # textChanged vide l'entrée du cache
+                if parsed is not None:
+                    self._messages_cache[side] = parsed
 
     def to_dict(self):
+        """Dict du scénario, partagé tant qu'aucun champ ne change : ne pas le modifier."""
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self):
         mode = "byte" if self.mode_byte.isChecked() else "audio"
         return {
             "mode": mode,
             "duration_ms": self.duration_spin.value(),
             "seed": self.seed_spin.value(),
-            "network": {
+            "network": {  # QDoubleSpinBox.value() est déjà arrondi à setDecimals()
                 "bearer": self.bearer_combo.currentText(),
-                "loss_rate": round(self.loss_spin.value(), 3),
+                "loss_rate": self.loss_spin.value(),
                 "latency_ms": self.latency_spin.value(),
                 "jitter_ms": self.jitter_spin.value(),
-                "reorder_rate": round(self.reorder_spin.value(), 3),
-                "ge_p_good_bad": round(self.ge_good_bad_spin.value(), 4),
-                "ge_p_bad_good": round(self.ge_bad_good_spin.value(), 4),
+                "reorder_rate": self.reorder_spin.value(),
+                "ge_p_good_bad": self.ge_good_bad_spin.value(),
+                "ge_p_bad_good": self.ge_bad_good_spin.value(),
                 "mtu_bytes": self.mtu_spin.value()
             },
             "messages": {
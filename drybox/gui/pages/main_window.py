@@ -1,9 +1,11 @@
+from functools import partial
 from pathlib import Path
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QStackedWidget, QMenu, QSizePolicy,
     QFileDialog, QMessageBox
 )
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QAction
 
 from drybox.gui.utils.helpers import (
@@ -26,13 +28,12 @@ class MainWindow(QMainWindow):
         self.current_scenario: Path | None = None
 
         # --- Pages ---
+        # Seule la page visible au démarrage est construite ; General et Runner
+        # (graphes pyqtgraph) le sont au premier accès via _get_page()
         self.stack = QStackedWidget()
-        self.adapters_page = AdaptersPage()
-        self.general_page = GeneralPage()
-        self.runner_page = RunnerPage(self.general_page, self.adapters_page)
-        self.stack.addWidget(self.adapters_page)
-        self.stack.addWidget(self.general_page)
-        self.stack.addWidget(self.runner_page)
+        self._pages: dict[str, QWidget | None] = {"adapters": None, "general": None, "runner": None}
+        self._get_page("adapters")
+        self._prewarm_scheduled = False
 
         # --- Navbar ---
         navbar = QWidget()
@@ -48,9 +49,9 @@ class MainWindow(QMainWindow):
         for btn in [self.btn_adapters, self.btn_general, self.btn_runner]:
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
             nav_buttons.addWidget(btn)
-        self.btn_adapters.clicked.connect(lambda: self.stack.setCurrentWidget(self.adapters_page))
-        self.btn_general.clicked.connect(lambda: self.stack.setCurrentWidget(self.general_page))
-        self.btn_runner.clicked.connect(lambda: self.stack.setCurrentWidget(self.runner_page))
+        self.btn_adapters.clicked.connect(partial(self._show_page, "adapters"))
+        self.btn_general.clicked.connect(partial(self._show_page, "general"))
+        self.btn_runner.clicked.connect(partial(self._show_page, "runner"))
         navbar_layout.addLayout(nav_buttons, 1)
 
         # Right side: Run / Stop / Scenario menu
@@ -89,6 +90,46 @@ class MainWindow(QMainWindow):
         self.action_save.triggered.connect(self.save_scenario)
         self.action_save_as.triggered.connect(self.save_scenario_as)
 
+    # === Pages (construction paresseuse) ===
+    def _get_page(self, name: str) -> QWidget:
+        page = self._pages[name]
+        if page is None:
+            if name == "adapters":
+                page = AdaptersPage()
+            elif name == "general":
+                page = GeneralPage()
+            else:
+                # Le runner lit les deux autres pages
+                page = RunnerPage(self._get_page("general"), self._get_page("adapters"))
+            self._pages[name] = page
+            self.stack.addWidget(page)
+        return page
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Après le premier affichage : General puis Runner construits pendant
+        # les temps morts de la boucle Qt, avant le premier clic
+        if not self._prewarm_scheduled:
+            self._prewarm_scheduled = True
+            QTimer.singleShot(0, partial(self._get_page, "general"))
+            QTimer.singleShot(50, partial(self._get_page, "runner"))
+
+    def _show_page(self, name: str, *_) -> None:
+        # *_ : clicked(bool) peut transmettre l'état du bouton
+        self.stack.setCurrentWidget(self._get_page(name))
+
+    @property
+    def adapters_page(self) -> AdaptersPage:
+        return self._get_page("adapters")
+
+    @property
+    def general_page(self) -> GeneralPage:
+        return self._get_page("general")
+
+    @property
+    def runner_page(self) -> RunnerPage:
+        return self._get_page("runner")
+
     # === Run / Stop logic ===
     def on_run_clicked(self, checked: bool):
         if checked:
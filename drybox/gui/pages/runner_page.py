@@ -1,13 +1,20 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QLabel, QTextEdit, QProgressBar, QSplitter
+    QLabel, QPlainTextEdit, QProgressBar, QSplitter
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from datetime import datetime
 from pathlib import Path
 import tempfile
+import time
 import yaml
 
+# Émetteur libyaml si PyYAML a été compilé avec, sinon pur Python
+try:
+    from yaml import CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+
 from drybox.core.paths import get_runs_dir, safe_mkdir
 from drybox.gui.runner.runner_thread import RunnerThread
 from drybox.gui.widgets.metrics_graphs import (
@@ -15,6 +22,12 @@ from drybox.gui.widgets.metrics_graphs import (
     SummaryStatsWidget
 )
 
+# Lignes de log regroupées et écrites au plus une fois par LOG_FLUSH_MS :
+# une seule mise en page du document par lot au lieu d'une par ligne
+LOG_FLUSH_MS = 50
+METRICS_FLUSH_MS = 100  # métriques reçues appliquées aux graphes par lots (un redessin par lot)
+LOG_MAX_BLOCKS = 2000  # lignes gardées dans la console (les plus anciennes sont élaguées)
+
 
 class RunnerPage(QWidget):
     """Runner page with graphs, log, status, and progress bar.
@@ -28,9 +41,24 @@ class RunnerPage(QWidget):
         self.adapters_page = adapters_page
         self.runner_thread = None
         self.temp_scenario_file = None
+        self._log_pending = []
+        self._metrics_pending = []
+        # "HH:MM:SS" de la seconde courante, reformaté une fois par seconde
+        self._ts_sec = -1
+        self._ts_prefix = ""
 
         self.init_ui()
 
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        self._metrics_flush_timer = QTimer(self)
+        self._metrics_flush_timer.setSingleShot(True)
+        self._metrics_flush_timer.setInterval(METRICS_FLUSH_MS)
+        self._metrics_flush_timer.timeout.connect(self._flush_metrics)
+
     def init_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(5)
@@ -80,8 +108,9 @@ class RunnerPage(QWidget):
         bottom_layout.addWidget(self.progress_bar)
 
         # Log text box
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.log_text.setMinimumHeight(100)
         bottom_layout.addWidget(self.log_text)
 
@@ -94,21 +123,34 @@ class RunnerPage(QWidget):
 
     # === Logging ===
     def append_log(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        self.log_text.append(f"[{timestamp}] {message}")
-        self.log_text.verticalScrollBar().setValue(
-            self.log_text.verticalScrollBar().maximum()
-        )
+        # Horodatage à la réception ; écriture différée au prochain lot
+        ns = time.time_ns()
+        sec, rem = divmod(ns, 1_000_000_000)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = time.strftime("%H:%M:%S", time.localtime(sec))
+        self._log_pending.append(f"[{self._ts_prefix}.{rem // 1_000_000:03d}] {message}")
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        if not self._log_pending:
+            return
+        # Défile seul si la vue était en bas ; sinon la position de lecture est gardée
+        self.log_text.appendPlainText("\n".join(self._log_pending))
+        self._log_pending.clear()
 
     # === Runner logic ===
     def run_scenario(self):
         """Start scenario using RunnerThread"""
+        self._log_pending.clear()
         self.log_text.clear()
         self.progress_bar.setValue(0)
         self.progress_bar.show()
         self.status_label.setText("Starting...")
 
         # Clear previous graph data
+        self._metrics_pending.clear()
         self.left_metrics_graph.clear_data()
         self.right_metrics_graph.clear_data()
 
@@ -146,11 +188,10 @@ class RunnerPage(QWidget):
                 self.append_log(f"Runs directory fallback -> {output_dir_path}")
 
             # === Scenario file alongside run artifacts ===
+            # Sérialisé une fois : le même texte est écrit puis journalisé
             scenario_path = output_dir_path / "scenario.gui.yaml"
-            scenario_path.write_text(
-                yaml.safe_dump(scenario, sort_keys=False),
-                encoding="utf-8"
-            )
+            scenario_contents = yaml.dump(scenario, Dumper=_YDumper, sort_keys=False)
+            scenario_path.write_text(scenario_contents, encoding="utf-8")
             self.temp_scenario_file = str(scenario_path)
 
             # === Messages file alongside scenario ===
@@ -159,16 +200,11 @@ class RunnerPage(QWidget):
                 "left": self.general_page.get_messages_left(),
                 "right": self.general_page.get_messages_right()
             }
-            messages_path.write_text(
-                yaml.safe_dump(messages_data, sort_keys=False),
-                encoding="utf-8"
-            )
-            
+            messages_contents = yaml.dump(messages_data, Dumper=_YDumper, sort_keys=False)
+            messages_path.write_text(messages_contents, encoding="utf-8")
+
             # --- LOG THE GENERATED YAML ---
-            scenario_contents = scenario_path.read_text(encoding="utf-8")
             self.append_log("Generated scenario.yaml contents:\n" + scenario_contents)
-            
-            messages_contents = messages_path.read_text(encoding="utf-8")
             self.append_log("Generated messages.yaml contents:\n" + messages_contents)
 
             output_dir = str(output_dir_path)
@@ -213,7 +249,8 @@ class RunnerPage(QWidget):
         self.runner_thread = None
         self.progress_bar.hide()
 
-        # Finalize summary statistics
+        # Finalize summary statistics (après les dernières métriques en attente)
+        self._flush_metrics()
         self.left_metrics_graph.finalize()
 
         if exit_code == 0:
@@ -227,6 +264,15 @@ class RunnerPage(QWidget):
         self.temp_scenario_file = None
 
     def _on_metrics_update(self, metrics: dict):
-        """Handle real-time metrics updates from runner."""
-        self.left_metrics_graph.update_metrics(metrics)
-        self.right_metrics_graph.update_metrics(metrics)
+        """Handle real-time metrics updates from runner (applied in batches)."""
+        self._metrics_pending.append(metrics)
+        if not self._metrics_flush_timer.isActive():
+            self._metrics_flush_timer.start()
+
+    def _flush_metrics(self):
+        if not self._metrics_pending:
+            return
+        batch = self._metrics_pending
+        self._metrics_pending = []
+        self.left_metrics_graph.update_metrics_bulk(batch)
+        self.right_metrics_graph.update_metrics_bulk(batch)
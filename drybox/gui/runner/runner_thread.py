@@ -1,6 +1,29 @@
 from PySide6.QtCore import QThread, Signal
 import subprocess, sys, os
+import io
 import re
+import time
+
+# Tampon de lecture du stdout du runner : moins d'appels read() par ligne
+PIPE_BUFFER_BYTES = 1 << 17
+# Barre de progression : émise seulement si le pourcentage change, ~20 Hz max
+PROGRESS_MIN_INTERVAL_NS = 50_000_000
+
+# Lignes de métriques du runner (voir _parse_metrics_line), compilées une fois
+# Byte mode (étendu avec RTT et goodput)
+_BYTE_RE = re.compile(
+    r'\[\s*(\d+)\s*ms\]\s*'
+    r'L->R\s+loss=([\d.]+)\s+reord=([\d.]+)\s+jitter=([\d.]+)ms\s*\|\s*'
+    r'R->L\s+loss=([\d.]+)\s+reord=([\d.]+)\s+jitter=([\d.]+)ms'
+    r'(?:\s*\|\s*rtt=([\d.]+)ms\s+gp_l=([\d.]+)bps\s+gp_r=([\d.]+)bps)?'
+)
+# Audio mode (étendu avec SNR, BER, PER et octets) ; SNR peut valoir 'inf'
+_AUDIO_RE = re.compile(
+    r'\[\s*(\d+)\s*ms\]\s*Mode B Audio'
+    r'(?:\s*\|\s*snr=([\d.inf-]+)dB\s+ber=([\d.]+)\s+per=([\d.]+)\s+'
+    r'total_bytes=(\d+)\s+total_lost_bytes=(\d+)\s+total_bytes_l=(\d+)\s+total_bytes_r=(\d+))?'
+)
+
 
 class RunnerThread(QThread):
     log_signal = Signal(str)
@@ -17,13 +40,16 @@ class RunnerThread(QThread):
         self.output_dir = output_dir
         self.process = None
         self.duration_ms = self._parse_duration()
+        self._last_pct = -1
+        self._last_progress_ns = 0
 
     def _parse_duration(self) -> int:
         """Parse duration_ms from scenario file"""
         try:
             import yaml
             with open(self.scenario_path, 'r') as f:
-                scenario = yaml.safe_load(f)
+                # libyaml si disponible ; fichier lu d'un bloc
+                scenario = yaml.load(f.read(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
                 return scenario.get('duration_ms', 2500)
         except:
             return 5000
@@ -37,14 +63,12 @@ class RunnerThread(QThread):
         Audio mode format:
         [  1000 ms] Mode B Audio | snr=20.0dB ber=0.0010 per=0.050 total_bytes=50 total_lost_bytes=2 total_bytes_l=100 total_bytes_r=200
         """
-        # Pattern for byte mode metrics (extended with RTT and goodput)
-        byte_pattern = (
-            r'\[\s*(\d+)\s*ms\]\s*'
-            r'L->R\s+loss=([\d.]+)\s+reord=([\d.]+)\s+jitter=([\d.]+)ms\s*\|\s*'
-            r'R->L\s+loss=([\d.]+)\s+reord=([\d.]+)\s+jitter=([\d.]+)ms'
-            r'(?:\s*\|\s*rtt=([\d.]+)ms\s+gp_l=([\d.]+)bps\s+gp_r=([\d.]+)bps)?'
-        )
-        match = re.search(byte_pattern, line)
+        # Les deux formats contiennent "ms]" : les autres lignes de log
+        # sont écartées sans passer par les regex
+        if "ms]" not in line:
+            return None
+
+        match = _BYTE_RE.search(line)
         if match:
             result = {
                 't_ms': int(match.group(1)),
@@ -65,14 +89,7 @@ class RunnerThread(QThread):
                 result['goodput_r_bps'] = float(match.group(10))
             return result
 
-        # Pattern for audio mode (extended with SNR, BER, PER, frames, and bytes)
-        # SNR can be 'inf' or a number like '20.0'
-        audio_pattern = (
-            r'\[\s*(\d+)\s*ms\]\s*Mode B Audio'
-            r'(?:\s*\|\s*snr=([\d.inf-]+)dB\s+ber=([\d.]+)\s+per=([\d.]+)\s+'
-            r'total_bytes=(\d+)\s+total_lost_bytes=(\d+)\s+total_bytes_l=(\d+)\s+total_bytes_r=(\d+))?'
-        )
-        match = re.search(audio_pattern, line)
+        match = _AUDIO_RE.search(line)
         if match:
             result = {
                 't_ms': int(match.group(1)),
@@ -119,11 +136,13 @@ class RunnerThread(QThread):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1
+                bufsize=PIPE_BUFFER_BYTES
             )
+            # Décodage local (encodage de la locale, comme text=True) ; un octet
+            # invalide ne doit pas interrompre le suivi du run
+            stdout = io.TextIOWrapper(self.process.stdout, errors="replace")
 
-            for line in self.process.stdout:
+            for line in stdout:
                 line = line.strip()
                 if line:
                     self.log_signal.emit(line)
@@ -136,7 +155,12 @@ class RunnerThread(QThread):
                         t_ms = metrics.get('t_ms', 0)
                         if self.duration_ms > 0:
                             progress = min(100, int(100 * t_ms / self.duration_ms))
-                            self.progress_signal.emit(progress)
+                            now = time.monotonic_ns()
+                            if (progress != self._last_pct
+                                    and now - self._last_progress_ns >= PROGRESS_MIN_INTERVAL_NS):
+                                self._last_pct = progress
+                                self._last_progress_ns = now
+                                self.progress_signal.emit(progress)
 
             exit_code = self.process.wait()
             if exit_code == 0:
@@ -2,8 +2,34 @@ from pathlib import Path
 import yaml
 from typing import Tuple
 
+# Parseur/émetteur libyaml si PyYAML a été compilé avec, sinon pur Python
+try:
+    from yaml import CSafeLoader as _YLoader, CSafeDumper as _YDumper
+except ImportError:
+    from yaml import SafeLoader as _YLoader, SafeDumper as _YDumper
+
+from PySide6.QtWidgets import QDoubleSpinBox, QSpinBox
+
 from drybox.core.paths import SCENARIOS_DIR
 
+# === Widget helpers ===
+
+def make_spin_box(lo, hi, value, step=None, decimals=None):
+    """Build a QSpinBox, or a QDoubleSpinBox when *decimals* is given.
+    Decimals are set first so Qt rounds range and value at the final precision;
+    step defaults to Qt's own (1 / 1.0).
+    """
+    if decimals is None:
+        w = QSpinBox()
+    else:
+        w = QDoubleSpinBox()
+        w.setDecimals(decimals)
+    w.setRange(lo, hi)
+    if step is not None:
+        w.setSingleStep(step)
+    w.setValue(value)
+    return w
+
 # === Scenario helpers ===
 
 def collect_scenario(general_page, adapters_page) -> dict:
@@ -23,12 +49,12 @@ def apply_scenario(general_page, adapters_page, scenario: dict):
 def load_scenario_file(path: Path) -> dict:
     """Load a YAML scenario file"""
     with open(path, "r") as f:
-        return yaml.safe_load(f) or {}
+        return yaml.load(f.read(), Loader=_YLoader) or {}
 
 def save_scenario_file(path: Path, scenario: dict):
     """Save a YAML scenario file"""
     with open(path, "w") as f:
-        yaml.safe_dump(scenario, f, sort_keys=False)
+        yaml.dump(scenario, f, Dumper=_YDumper, sort_keys=False)
 
 # === Scenario path helpers ===
 
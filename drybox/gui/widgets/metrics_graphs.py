@@ -8,6 +8,18 @@ from PySide6.QtGui import QFont
 import pyqtgraph as pg
 import numpy as np
 
+def _update_metrics_bulk(container, graphs, batch):
+    """Apply *batch* through container.update_metrics with one redraw per graph."""
+    for graph in graphs:
+        graph.hold_plots(True)
+    try:
+        for metrics in batch:
+            container.update_metrics(metrics)
+    finally:
+        for graph in graphs:
+            graph.hold_plots(False)
+
+
 class IntAxisItem(pg.AxisItem):
     def tickStrings(self, values, scale, spacing):
         # values: list of float tick positions
@@ -27,6 +39,10 @@ class MetricsGraphWidget(QWidget):
         self.time_data = []
         self.datasets = {}  # name -> list of values
 
+        # Redraw deferred while a batch of metrics is applied (see hold_plots)
+        self._hold_plots = False
+        self._plots_stale = False
+
         self._init_ui()
 
     def _init_ui(self):
@@ -80,7 +96,17 @@ class MetricsGraphWidget(QWidget):
                 if len(self.datasets[name]) > self.max_points:
                     self.datasets[name] = self.datasets[name][-self.max_points:]
 
-        self._update_plots()
+        if self._hold_plots:
+            self._plots_stale = True
+        else:
+            self._update_plots()
+
+    def hold_plots(self, hold: bool):
+        """Defer curve redraws while *hold* is True; redraw once on release."""
+        self._hold_plots = hold
+        if not hold and self._plots_stale:
+            self._plots_stale = False
+            self._update_plots()
 
     def _update_plots(self):
         """Update all plot curves with current data."""
@@ -268,6 +294,7 @@ class DualDirectionMetricsGraph(QWidget):
         layout.addWidget(self.l2r_graph)
         layout.addWidget(self.r2l_graph)
         layout.addWidget(self.frame_stats_graph)
+        self._plot_graphs = (self.l2r_graph, self.r2l_graph, self.frame_stats_graph)
 
         # Initially show byte mode
         self.frame_stats_graph.setVisible(False)
@@ -297,6 +324,10 @@ class DualDirectionMetricsGraph(QWidget):
         elif mode == 'audio':
             self.frame_stats_graph.update_metrics(metrics)
 
+    def update_metrics_bulk(self, batch: list):
+        """Apply several metrics dicts in order, redrawing each graph once."""
+        _update_metrics_bulk(self, self._plot_graphs, batch)
+
     def clear_data(self):
         """Clear all graph data."""
         self.l2r_graph.clear_data()
@@ -738,6 +769,8 @@ class EnhancedCombinedMetricsGraph(QWidget):
 
         # Summary always at bottom
         layout.addWidget(self.summary_stats)
+        self._plot_graphs = (self.network_graph, self.jitter_graph, self.goodput_graph,
+                             self.rtt_graph, self.snr_graph, self.ber_per_graph)
 
         # Initially show byte mode
         self._show_byte_mode()
@@ -785,6 +818,10 @@ class EnhancedCombinedMetricsGraph(QWidget):
         # Always update summary stats
         self.summary_stats.update_metrics(metrics)
 
+    def update_metrics_bulk(self, batch: list):
+        """Apply several metrics dicts in order, redrawing each graph once."""
+        _update_metrics_bulk(self, self._plot_graphs, batch)
+
     def finalize(self):
         """Finalize summary statistics after simulation ends."""
         self.summary_stats.finalize()
@@ -10,10 +10,10 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class _InFlight:
     payload: bytes
     sent_ms: int
@@ -21,7 +21,7 @@ class _InFlight:
     seq: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BearerStatsSnapshot:
     loss_rate: float
     reorder_rate: float
@@ -33,14 +33,24 @@ class DatagramBearer:
     Modèle de transport "datagramme".
     - send(payload, now_ms) : schedule (pertes/jitter/latence/réordres)
     - poll_deliver(now_ms) : délivre les PDUs arrivés à échéance
+    - poll_deliver_batch(now_ms) : idem, en listes parallèles (sent_ms, payloads)
     - stats() : snapshot courants
+
+    File interne en colonnes (SoA) : échéances, instants d'envoi, numéros de
+    séquence et payloads dans des listes parallèles ; le balayage des
+    échéances ne touche qu'une liste d'entiers. L'échéance la plus proche
+    est tenue à jour : un poll avant elle ne balaie rien.
     """
 
     def __init__(self, *, rng: random.Random, mtu_bytes: int, latency_ms: int):
         self.rng = rng
         self.mtu_bytes = mtu_bytes
         self.latency_ms = latency_ms
-        self._queue: List[_InFlight] = []
+        self._q_deliver: List[int] = []
+        self._q_sent: List[int] = []
+        self._q_seq: List[int] = []
+        self._q_payload: List[bytes] = []
+        self._q_next: Optional[int] = None  # min(_q_deliver), None si vide
         self._drops = 0
         self._tx = 0
         self._reorders = 0
@@ -57,9 +67,9 @@ class DatagramBearer:
     def _extra_delay_ms(self) -> int:
         return 0
 
-    def _maybe_reorder(self, item: _InFlight) -> None:
+    def _reorder_delay_ms(self) -> int:
         # by default: rien
-        return
+        return 0
 
     # ----------------------------------------------------
     def send(self, payload: bytes, *, now_ms: int) -> None:
@@ -70,35 +80,77 @@ class DatagramBearer:
         base = self.latency_ms
         extra = self._extra_delay_ms()
         deliver = max(now_ms + base + extra, now_ms)
-        item = _InFlight(payload=bytes(payload), sent_ms=now_ms, deliver_ms=deliver, seq=self._seq_ctr)
+        # Optionnel réordonnancement (retard supplémentaire)
+        deliver += self._reorder_delay_ms()
+        self._q_deliver.append(deliver)
+        self._q_sent.append(now_ms)
+        self._q_seq.append(self._seq_ctr)
+        self._q_payload.append(bytes(payload))
+        if self._q_next is None or deliver < self._q_next:
+            self._q_next = deliver
         self._seq_ctr = (self._seq_ctr + 1) & 0x7FFFFFFF
-        # Optionnel réordonnancement
-        self._maybe_reorder(item)
-        self._queue.append(item)
 
-    def poll_deliver(self, now_ms: int) -> List[_InFlight]:
-        out: List[_InFlight] = []
-        keep: List[_InFlight] = []
-        for it in self._queue:
-            if it.deliver_ms <= now_ms:
-                out.append(it)
-                # Stats reorder:
-                if self._last_delivered_seq is not None and it.seq < self._last_delivered_seq:
-                    self._reorders += 1
-                self._last_delivered_seq = it.seq
-                # Jitter (diff des transits)
-                transit = it.deliver_ms - it.sent_ms
-                if self._last_transit is not None:
-                    d = abs(transit - self._last_transit)
-                    self._jitter += (d - self._jitter) / 16.0
-                self._last_transit = transit
-            else:
-                keep.append(it)
+    def _take_due(self, now_ms: int) -> List[int]:
+        """
+        Retire de la file les PDUs échus et renvoie leurs index (ordre de
+        livraison) dans les colonnes telles qu'avant compaction ; les stats
+        sont mises à jour dans l'ordre d'insertion.
+        """
+        if self._q_next is None or now_ms < self._q_next:
+            return []
+        dl = self._q_deliver
+        due = [i for i, d in enumerate(dl) if d <= now_ms]
+        sent, seqs = self._q_sent, self._q_seq
+        for i in due:
+            seq = seqs[i]
+            # Stats reorder:
+            if self._last_delivered_seq is not None and seq < self._last_delivered_seq:
+                self._reorders += 1
+            self._last_delivered_seq = seq
+            # Jitter (diff des transits)
+            transit = dl[i] - sent[i]
+            if self._last_transit is not None:
+                d = abs(transit - self._last_transit)
+                self._jitter += (d - self._jitter) / 16.0
+            self._last_transit = transit
         # Stable order among due items (simulate same-timestamp reorders already accounted)
-        out.sort(key=lambda x: x.deliver_ms)
-        self._queue = keep
+        due.sort(key=dl.__getitem__)
+        return due
+
+    def _compact(self, now_ms: int) -> None:
+        keep = [i for i, d in enumerate(self._q_deliver) if d > now_ms]
+        self._q_deliver = [self._q_deliver[i] for i in keep]
+        self._q_sent = [self._q_sent[i] for i in keep]
+        self._q_seq = [self._q_seq[i] for i in keep]
+        self._q_payload = [self._q_payload[i] for i in keep]
+        self._q_next = min(self._q_deliver) if keep else None
+
+    def poll_deliver(self, now_ms: int) -> List[_InFlight]:
+        due = self._take_due(now_ms)
+        if not due:
+            return []
+        dl, sent, seqs, pls = self._q_deliver, self._q_sent, self._q_seq, self._q_payload
+        out = [_InFlight(payload=pls[i], sent_ms=sent[i], deliver_ms=dl[i], seq=seqs[i]) for i in due]
+        self._compact(now_ms)
         return out
 
+    def poll_deliver_batch(self, now_ms: int) -> Tuple[List[int], List[bytes]]:
+        """
+        Comme poll_deliver(), sans objet par PDU : (sent_ms, payloads) en
+        listes parallèles, dans l'ordre de livraison.
+        """
+        due = self._take_due(now_ms)
+        if not due:
+            return [], []
+        sent, pls = self._q_sent, self._q_payload
+        out = ([sent[i] for i in due], [pls[i] for i in due])
+        self._compact(now_ms)
+        return out
+
+    def next_deliver_ms(self) -> Optional[int]:
+        """Échéance de livraison la plus proche (None si rien en vol)."""
+        return self._q_next
+
     def stats(self) -> BearerStatsSnapshot:
         loss = (self._drops / self._tx) if self._tx else 0.0
         reord = (self._reorders / max(1, self._tx - self._drops)) if self._tx else 0.0
@@ -146,11 +198,12 @@ class TelcoVolteEvs(DatagramBearer):
         val = max(-3 * sigma, min(3 * sigma, val))
         return int(round(val))
 
-    def _maybe_reorder(self, item: _InFlight) -> None:
+    def _reorder_delay_ms(self) -> int:
         if self.reorder_rate <= 0:
-            return
+            return 0
         if self.rng.random() < self.reorder_rate:
-            item.deliver_ms += self.frame_ms  # retarde d'un frame -> possiblement inversé
+            return self.frame_ms  # retarde d'un frame -> possiblement inversé
+        return 0
 
 
 # -------------------- CS GSM --------------------
@@ -226,9 +279,10 @@ class OttUdp(DatagramBearer):
     def _extra_delay_ms(self) -> int:
         return int(self.rng.gauss(0.0, max(1.0, self.jitter_ms / 2.0)))
 
-    def _maybe_reorder(self, item: _InFlight) -> None:
+    def _reorder_delay_ms(self) -> int:
         if self.rng.random() < self.reorder_rate:
-            item.deliver_ms += self.frame_ms
+            return self.frame_ms
+        return 0
 
 
 # -------------------- Factory --------------------
@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional
 
 
 HEADER_LEN = 3
@@ -28,30 +28,42 @@ class SARFragmenter:
         Découpe l'SDU en fragments avec en-tête 3B.
         Si un seul fragment, on émet quand même un header (last=1).
         """
+        return list(self.iter_fragments(sdu))
+
+    def iter_fragments(self, sdu: bytes) -> Iterator[bytes]:
+        """
+        Variante paresseuse de fragment() (pas de liste intermédiaire).
+        Le frag_id est réservé à l'appel, pas à la consommation.
+        """
+        fid = self._frag_id
+        self._frag_id = _u8(fid + 1)
         cap = self.mtu - HEADER_LEN
         if len(sdu) <= cap:
-            out = [bytes((_u8(self._frag_id), 0, 1)) + sdu]
-            self._frag_id = _u8(self._frag_id + 1)
-            return out
-        # fragments multiples
-        out: list[bytes] = []
-        fid = self._frag_id
-        self._frag_id = _u8(self._frag_id + 1)
+            return iter((bytes((fid, 0, 1)) + sdu,))
+        return self._gen_fragments(fid, sdu, cap)
+
+    @staticmethod
+    def _gen_fragments(fid: int, sdu: bytes, cap: int) -> Iterator[bytes]:
+        # fragments multiples : tranches de memoryview (pas de copie
+        # intermédiaire), seul le fragment final porte last=1
+        mv = memoryview(sdu)
         n = (len(sdu) + cap - 1) // cap
-        for idx in range(n):
-            beg = idx * cap
-            end = min(len(sdu), beg + cap)
-            last = 1 if idx == (n - 1) else 0
-            out.append(bytes((_u8(fid), _u8(idx), _u8(last))) + sdu[beg:end])
-        return out
+        fid = _u8(fid)
+        beg = 0
+        for idx in range(n - 1):
+            end = beg + cap
+            yield bytes((fid, _u8(idx), 0)) + mv[beg:end]
+            beg = end
+        yield bytes((fid, _u8(n - 1), 1)) + mv[beg:]
 
 
-@dataclass
+@dataclass(slots=True)
 class _Group:
     # premier arrivée -> start_ms (pour timeout)
     start_ms: int
     last_idx: Optional[int] = None
-    parts: Dict[int, bytes] = field(default_factory=dict)
+    # vues sur les fragments reçus (pas de copie avant le join final)
+    parts: Dict[int, memoryview] = field(default_factory=dict)
 
 
 class SARReassembler:
@@ -74,12 +86,16 @@ class SARReassembler:
         fid = frag[0]
         idx = frag[1]
         last = frag[2]
-        payload = frag[HEADER_LEN:]
 
         # Gère timeouts
         self._evict_timeouts(now_ms)
 
         grp = self._groups.get(fid)
+        if grp is None and idx == 0 and last == 1:
+            # SDU mono-fragment : ni groupe ni join
+            return bytes(frag[HEADER_LEN:])
+        payload = memoryview(frag)[HEADER_LEN:]
+
         if grp is None:
             grp = _Group(start_ms=now_ms)
             self._groups[fid] = grp
@@ -92,7 +108,7 @@ class SARReassembler:
         # Complet ?
         if grp.last_idx is not None:
             needed = grp.last_idx + 1
-            if all(i in grp.parts for i in range(needed)):
+            if len(grp.parts) >= needed and all(i in grp.parts for i in range(needed)):
                 # Ré-assemble
                 sdu = b"".join(grp.parts[i] for i in range(needed))
                 del self._groups[fid]
@@ -4,6 +4,9 @@
 import numpy as np
 from typing import Optional
 
+# Nombre de blocs de bruit unitaire tirés en un seul appel RNG
+NOISE_PREFETCH_BLOCKS = 8
+
 
 class AWGNChannel:
     """
@@ -21,6 +24,22 @@ class AWGNChannel:
         """
         self.snr_db = snr_db
         self.rng = np.random.RandomState(seed)
+        # Bruit N(0,1) pré-tiré : même flux que des appels normal() successifs
+        self._noise = np.empty(0)
+        self._noise_pos = 0
+
+    def _unit_noise(self, n: int) -> np.ndarray:
+        """
+        Return the next n samples of the N(0,1) stream, drawing
+        NOISE_PREFETCH_BLOCKS blocks at a time from the RNG.
+        """
+        pos = self._noise_pos
+        if pos + n > len(self._noise):
+            fresh = self.rng.standard_normal(n * NOISE_PREFETCH_BLOCKS)
+            self._noise = np.concatenate((self._noise[pos:], fresh))
+            pos = 0
+        self._noise_pos = pos + n
+        return self._noise[pos:pos + n]
         
     def apply(self, signal: np.ndarray) -> np.ndarray:
         """
@@ -50,7 +69,7 @@ class AWGNChannel:
         noise_power = sig_power / snr_linear
         
         # Generate AWGN
-        noise = self.rng.normal(0, np.sqrt(noise_power), len(sig_float))
+        noise = np.sqrt(noise_power) * self._unit_noise(len(sig_float))
         
         # Add noise to signal
         noisy_signal = sig_float + noise
@@ -51,22 +51,21 @@ class RayleighFadingChannel:
         dt = n_samples / self.sample_rate
         self.t += dt
         
-        # Update each path with different Doppler shifts
-        for i in range(self.L):
-            # Random Doppler frequency for each path
-            doppler = self.fd_hz * (0.5 + 0.5 * self.rng.rand())
-            phase_shift = 2 * np.pi * doppler * dt
-            
-            # Apply phase rotation
-            cos_phi = np.cos(phase_shift)
-            sin_phi = np.sin(phase_shift)
-            
-            h_real_new = self.h_real[i] * cos_phi - self.h_imag[i] * sin_phi
-            h_imag_new = self.h_real[i] * sin_phi + self.h_imag[i] * cos_phi
-            
-            # Add small random walk
-            self.h_real[i] = h_real_new + 0.01 * self.rng.randn()
-            self.h_imag[i] = h_imag_new + 0.01 * self.rng.randn()
+        # Update all paths at once, each with its own random Doppler shift
+        doppler = self.fd_hz * (0.5 + 0.5 * self.rng.rand(self.L))
+        phase_shift = 2 * np.pi * doppler * dt
+        
+        # Apply phase rotation
+        cos_phi = np.cos(phase_shift)
+        sin_phi = np.sin(phase_shift)
+        
+        h_real_new = self.h_real * cos_phi - self.h_imag * sin_phi
+        h_imag_new = self.h_real * sin_phi + self.h_imag * cos_phi
+        
+        # Add small random walk
+        walk = self.rng.randn(2, self.L)
+        self.h_real = h_real_new + 0.01 * walk[0]
+        self.h_imag = h_imag_new + 0.01 * walk[1]
         
         # Renormalize to maintain average power
         power = np.sqrt(np.sum(self.h_real**2 + self.h_imag**2))
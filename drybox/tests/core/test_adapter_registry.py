@@ -90,3 +90,15 @@ def test_resolve_identifier_fallback(tmp_path: Path, monkeypatch):
     assert info_entry.spec == "entrypoint:nade-python"
     assert info_entry.identifier == "entrypoint:nade-python"
 
+
+def test_load_adapter_class_from_file_is_cached_until_modified(tmp_path: Path):
+    adapter_file = tmp_path / "cached_adapter.py"
+    adapter_file.write_text("class Adapter:\n    VERSION = 1\n", encoding="utf-8")
+
+    first = adapter_registry.load_adapter_class(str(adapter_file))
+    assert adapter_registry.load_adapter_class(f"{adapter_file}:Adapter") is first
+
+    adapter_file.write_text("class Adapter:\n    VERSION = 22\n", encoding="utf-8")
+    reloaded = adapter_registry.load_adapter_class(str(adapter_file))
+    assert reloaded is not first
+    assert reloaded.VERSION == 22
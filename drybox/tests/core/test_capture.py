@@ -29,3 +29,44 @@ def test_dbxcap_layout(tmp_path: Path):
     assert ev_b == 0          # "tx"
     assert length == 3
     assert payload == b"\x01\x02\x03"
+
+
+def test_dbxcap_write_many_matches_write(tmp_path: Path):
+    recs = [(1, "L", "bearer", "tx", b"ab"), (2, "R", "bearer", "rx", b""), (3, "L", "bytelink", "drop", b"xyz")]
+    a = DbxCapWriter(tmp_path / "a.dbxcap")
+    for t, s, l, e, d in recs:
+        a.write(t_ms=t, side=s, layer=l, event=e, data=d)
+    a.close()
+    b = DbxCapWriter(tmp_path / "b.dbxcap")
+    b.write_many(recs)
+    b.close()
+    assert (tmp_path / "a.dbxcap").read_bytes() == (tmp_path / "b.dbxcap").read_bytes()
+
+
+def test_dbxcap_snapshots_mutable_buffers(tmp_path: Path):
+    # Un bytearray modifié après write() ne doit pas altérer l'enregistrement bufferisé
+    p = tmp_path / "capture.dbxcap"
+    w = DbxCapWriter(p)
+    data = bytearray(b"abc")
+    w.write(t_ms=1, side="R", layer="bearer", event="rx", data=data)
+    data[:] = b"xyz"
+    w.close()
+
+    assert p.read_bytes()[5 + 15:] == b"abc"
+
+
+def test_dbxcap_io_thread_output_identical(tmp_path: Path):
+    # Lots délégués à un IOThread (writelines) : fichier identique
+    from drybox.core.io_thread import IOThread
+
+    recs = [(t, "LR"[t % 2], "bearer", "tx", bytes([t % 251]) * (t % 9)) for t in range(700)]
+    a = DbxCapWriter(tmp_path / "a.dbxcap")
+    a.write_many(recs)
+    a.close()
+    io = IOThread()
+    b = DbxCapWriter(tmp_path / "b.dbxcap", io)
+    for i in range(0, len(recs), 50):
+        b.write_many(recs[i:i + 50])
+    b.close()
+    io.close()
+    assert (tmp_path / "a.dbxcap").read_bytes() == (tmp_path / "b.dbxcap").read_bytes()
@@ -44,3 +44,59 @@ def test_metrics_header_and_rows(tmp_path: Path):
     rec = json.loads(lines[0])
     assert rec["type"] == "hs_syn"
     assert rec["payload"]["role"] == "init"
+
+
+def test_specialized_rows_match_write_metric(tmp_path: Path):
+    # Les variantes pré-formatées doivent produire exactement les mêmes lignes
+    ref = MetricsWriter(tmp_path / "ref.csv", tmp_path / "ref.jsonl")
+    ref.write_metric(t_ms=10, side="L", layer="bearer", event="tx", rtt_ms_est=120.0)
+    ref.write_metric(t_ms=20, side="R", layer="bytelink", event="rx",
+                     latency_ms=61.0, jitter_ms=2.5, loss_rate=0.01, reorder_rate=0.0)
+    ref.write_metric(t_ms=20, side="R", layer="audioblock", event="rx", latency_ms=0.0)
+    ref.write_metric(t_ms=30, side="L", layer="audioblock", event="rx", snr_db_est=9.5)
+    ref.write_metric(t_ms=30, side="L", layer="audioblock", event="drop", per=1.0)
+    ref.write_metric(t_ms=1000, side="L", layer="bytelink", event="tick", goodput_bps=8000.0)
+    ref.close()
+
+    fast = MetricsWriter(tmp_path / "fast.csv", tmp_path / "fast.jsonl")
+    fast.write_tx(10, "L", "bearer", 120.0)
+    fast.write_rx(20, "R", "bytelink", 61.0, 2.5, 0.01, 0.0)
+    fast.write_rx_latency(20, "R", "audioblock", 0.0)
+    fast.write_rx_snr(30, "L", "audioblock", 9.5)
+    fast.write_drop_per(30, "L", "audioblock", 1.0)
+    fast.write_tick_goodput(1000, "L", "bytelink", 8000.0)
+    fast.close()
+
+    assert (tmp_path / "fast.csv").read_bytes() == (tmp_path / "ref.csv").read_bytes()
+
+
+def test_io_thread_output_identical(tmp_path: Path):
+    # Même contenu (et même ordre) avec écritures déléguées à un IOThread
+    from drybox.core.io_thread import IOThread
+
+    def emit(mw: MetricsWriter):
+        for t in range(600):
+            mw.write_tx(t, "L", "bearer", 80.0)
+            if t % 7 == 0:
+                mw.write_metric(t_ms=t, side="R", layer="bytelink", event="rx", latency_ms=1.5)
+            mw.write_event(t, "L", "log", {"n": t})
+        mw.close()
+
+    emit(MetricsWriter(tmp_path / "a.csv", tmp_path / "a.jsonl"))
+    io = IOThread()
+    emit(MetricsWriter(tmp_path / "b.csv", tmp_path / "b.jsonl", io))
+    io.close()
+
+    assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes()
+    assert (tmp_path / "a.jsonl").read_bytes() == (tmp_path / "b.jsonl").read_bytes()
+
+
+def test_event_line_orjson_and_stdlib_agree():
+    # Avec ou sans orjson : une ligne JSON compacte par événement, même contenu
+    from drybox.core.metrics import _event_line, _event_line_std
+
+    rec = {"t_ms": 7, "side": "R", "type": "metric", "payload": {"event": "demod", "x": 0.25, "s": "é", 3: [1, 2]}}
+    for line in (_event_line(rec), _event_line_std(rec)):
+        assert line.endswith(b"\n") and line.count(b"\n") == 1
+        assert b", " not in line and b": " not in line
+        assert json.loads(line) == json.loads(json.dumps(rec))
@@ -0,0 +1,56 @@
+# drybox/tests/core/test_runner_event_driven.py
+from __future__ import annotations
+from pathlib import Path
+
+from drybox.core.runner import Runner
+from drybox.core.scenario import ScenarioResolved
+
+TRAFFIC = "adapters/test_traffic_adapter.py:Adapter"
+
+# Adaptateur sans on_timer ni next_tick_hint_ms : la réponse est mise en
+# file dans on_link_rx et relevée par poll_link_tx au tick suivant.
+ECHO_SRC = '''
+class Adapter:
+    def __init__(self):
+        self._q = []
+
+    def nade_capabilities(self):
+        return {"abi_version": "dbx-v1", "bytelink": True, "sdu_max_bytes": 512}
+
+    def on_link_rx(self, sdu):
+        self._q.append(b"echo:" + sdu[:8])
+
+    def poll_link_tx(self, budget):
+        out, self._q = self._q[:budget], self._q[budget:]
+        return out
+'''
+
+
+def _run(tmp_path: Path, name: str, left: str, event_driven: bool) -> Path:
+    scen = ScenarioResolved.from_yaml_dict({
+        "mode": "byte",
+        "duration_ms": 2000,
+        "seed": 7,
+        "network": {"bearer": "volte_evs", "latency_ms": 40, "jitter_ms": 10,
+                    "loss_rate": 0.05, "reorder_rate": 0.05},
+        "left": {"adapter": left, "gain": 1.0},
+        "right": {"adapter": TRAFFIC, "gain": 1.0},
+    })
+    out = tmp_path / name
+    rc = Runner(
+        scenario=scen, left_adapter_spec=left, right_adapter_spec=TRAFFIC, out_dir=out,
+        tick_ms=10, seed=7, ui_enabled=False, event_driven=event_driven,
+    ).run()
+    assert rc == 0
+    return out
+
+
+def test_event_driven_matches_fixed_ticks(tmp_path: Path):
+    echo = tmp_path / "echo_adapter.py"
+    echo.write_text(ECHO_SRC)
+    for left in (f"{echo}:Adapter", TRAFFIC):
+        fixed = _run(tmp_path, "fixed", left, event_driven=False)
+        evented = _run(tmp_path, "evented", left, event_driven=True)
+        assert (fixed / "capture.dbxcap").stat().st_size > 5
+        for name in ("metrics.csv", "capture.dbxcap"):
+            assert (fixed / name).read_bytes() == (evented / name).read_bytes(), (left, name)
@@ -0,0 +1,49 @@
+# drybox/tests/core/test_runner_teardown.py
+from __future__ import annotations
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from drybox.core.runner import Runner
+from drybox.core.scenario import ScenarioResolved
+
+TRAFFIC = "adapters/test_traffic_adapter.py:Adapter"
+
+# Endpoint audio seulement : un scénario byte échoue avant la boucle (exit 3)
+AUDIO_ONLY_SRC = '''
+class Adapter:
+    def nade_capabilities(self):
+        return {"abi_version": "dbx-v1", "bytelink": False, "audioblock": True}
+
+    def start(self, ctx):
+        ctx.emit_event("log", {"level": "info", "msg": "audio only"})
+'''
+
+
+def test_outputs_flushed_when_mode_unsupported(tmp_path: Path):
+    adapter = tmp_path / "audio_only.py"
+    adapter.write_text(AUDIO_ONLY_SRC)
+    scen = ScenarioResolved.from_yaml_dict({
+        "mode": "byte",
+        "duration_ms": 1000,
+        "seed": 3,
+        "left": {"adapter": TRAFFIC, "gain": 1.0},
+        "right": {"adapter": f"{adapter}:Adapter", "gain": 1.0},
+    })
+    out = tmp_path / "run"
+    runner = Runner(
+        scenario=scen, left_adapter_spec=TRAFFIC, right_adapter_spec=f"{adapter}:Adapter",
+        out_dir=out, tick_ms=10, seed=3, ui_enabled=False,
+    )
+    with pytest.raises(SystemExit) as exc:
+        runner.run()
+    assert exc.value.code == 3
+
+    # En-tête dbxcap, en-tête CSV et événements start écrits malgré la sortie anticipée
+    assert (out / "capture.dbxcap").read_bytes() == b"DBXC\x01"
+    assert (out / "metrics.csv").read_text().startswith("t_ms,side,")
+    evs = [json.loads(x) for x in (out / "events.jsonl").read_text().splitlines()]
+    assert [e["side"] for e in evs] == ["L", "R"]
+    assert not any(t.name == "drybox-io" and t.is_alive() for t in threading.enumerate())
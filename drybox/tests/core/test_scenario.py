@@ -70,3 +70,16 @@ def test_sweep_snr_values(tmp_path: pathlib.Path):
     # Valeurs scalaires dans les clones
     vals = sorted(c.channel["snr_db"] for _, c in clones)
     assert vals == [0, 3]
+
+
+def test_from_yaml_dict_trusted_roundtrip():
+    base = ScenarioResolved.from_yaml_dict({
+        "mode": "byte",
+        "duration_ms": 1000,
+        "left": {"adapter": "nade-python", "gain": 1.0, "modem": {"snr_db": 9}},
+    })
+    # Dict produit par le programme : rechargé sans revalidation
+    again = ScenarioResolved.from_yaml_dict(base.to_resolved_dict(), trusted=True)
+    assert again == base
+    with pytest.raises(ScenarioValidationError):
+        ScenarioResolved.from_yaml_dict({"duration_ms": "bad"})
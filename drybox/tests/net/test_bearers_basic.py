@@ -5,7 +5,7 @@ from __future__ import annotations
 import statistics
 import random
 
-from drybox.net.bearers import TelcoVolteEvs, TelcoCsGsm
+from drybox.net.bearers import OttUdp, TelcoVolteEvs, TelcoCsGsm
 
 
 def _simulate_and_collect_latencies(bearer, duration_ms: int, send_period_ms: int = 20):
@@ -102,3 +102,43 @@ def test_bearer_determinism_with_seed():
 
     assert again == ref
     assert diff != ref
+
+
+def test_next_deliver_ms_tracks_earliest_in_flight():
+    """
+    next_deliver_ms() = échéance la plus proche en vol (None si file vide),
+    et poll_deliver() à cette échéance délivre au moins un PDU.
+    """
+    params = {"latency_ms": 60, "jitter_ms": 20, "loss_rate": 0.0, "reorder_rate": 0.0,
+              "ge_p_good_bad": 0.0, "ge_p_bad_good": 1.0}
+    b = TelcoVolteEvs(params, random.Random(7))
+    assert b.next_deliver_ms() is None
+
+    for t in (0, 20, 40):
+        b.send(b"x", now_ms=t)
+    nxt = b.next_deliver_ms()
+    assert nxt is not None
+    assert b.poll_deliver(now_ms=nxt - 1) == []
+    assert b.poll_deliver(now_ms=nxt)
+
+
+def test_poll_deliver_batch_matches_poll_deliver():
+    """
+    poll_deliver_batch() (colonnes) = poll_deliver() (objets) : même ordre,
+    mêmes payloads/sent_ms, mêmes stats.
+    """
+    params = {"latency_ms": 40, "jitter_ms": 15, "loss_rate": 0.1, "reorder_rate": 0.2}
+
+    def run(batch: bool):
+        b = OttUdp(params, random.Random(99))
+        got = []
+        for t in range(0, 2_000):
+            if t % 5 == 0:
+                b.send(t.to_bytes(2, "big"), now_ms=t)
+            if batch:
+                got.extend(zip(*b.poll_deliver_batch(t)))
+            else:
+                got.extend((it.sent_ms, it.payload) for it in b.poll_deliver(t))
+        return got, b.stats()
+
+    assert run(True) == run(False)
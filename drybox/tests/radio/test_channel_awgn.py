@@ -100,4 +100,14 @@ class TestAWGNChannel:
         actual_snr_db = 10 * np.log10(signal_power / noise_power)
         
         # Should be close to target SNR
-        assert abs(actual_snr_db - 10.0) < 1.0
\ No newline at end of file
+        assert abs(actual_snr_db - 10.0) < 1.0
+    
+    def test_prefetched_noise_matches_per_block_draws(self):
+        """Test that batched noise draws reproduce the per-block normal() stream"""
+        channel = AWGNChannel(snr_db=10.0, seed=7)
+        ref_rng = np.random.RandomState(7)
+        
+        # Tailles variables pour franchir plusieurs recharges du tampon
+        for n in (160, 37, 160 * 9, 1, 320):
+            expected = ref_rng.normal(0, 1.0, n)
+            np.testing.assert_array_equal(channel._unit_noise(n), expected)